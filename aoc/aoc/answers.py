@@ -0,0 +1,152 @@
+"""
+Store of puzzle answers, keyed by the solver's source and its input.
+
+The key covers the SHA-256 of the input file, of the solver module and of
+every module it imports from the repository or the `aoc` package, so
+editing any of them automatically invalidates the stored answers.
+"""
+import ast
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .days import Day
+from .parse_cache import file_digest
+
+
+STORE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "answers"
+
+
+def load(entry: Path) -> Optional[Dict[str, Any]]:
+    """
+    Returns the answers stored in `entry`, if any.
+    """
+    try:
+        return json.loads(entry.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(entry: Path, answers: Dict[str, Any]) -> None:
+    """
+    Atomically stores `answers`; answers that are not JSON values (like numpy scalars) are not stored.
+    """
+    try:
+        payload = json.dumps(answers)
+    except (TypeError, ValueError):
+        return
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=entry.parent, delete=False) as tmp:
+        tmp.write(payload)
+    os.replace(tmp.name, entry)
+
+
+def entry_path(day: Day, filename: str = "input.txt", sources: Optional[str] = None) -> Path:
+    """
+    Returns where the answers of `day` on `filename` are stored, given the input and the digest of the solver
+    sources (by default, of their current version).
+    """
+    digest = hashlib.sha256()
+    digest.update(day.name.encode())
+    digest.update(file_digest(day.input_path(filename)))
+    digest.update((sources or sources_digest(day)).encode())
+    return STORE_DIR / f"{digest.hexdigest()}.json"
+
+
+def sources_digest(day: Day) -> str:
+    """
+    Returns the SHA-256 of the current version of every source file the solver of `day` depends on.
+    """
+    digest = hashlib.sha256()
+    for source in solver_sources(day):
+        digest.update(str(source).encode())
+        digest.update(file_digest(source))
+    return digest.hexdigest()
+
+
+def solver_sources(day: Day) -> List[Path]:
+    """
+    Returns the source files the solver of `day` depends on: its module and, transitively,
+    the modules it imports from the year folder, the day folder or the `aoc` package.
+    """
+    return module_sources(day.path, (day.workdir, day.folder))
+
+
+def module_sources(path: Path, folders: Sequence[Path]) -> List[Path]:
+    """
+    Returns `path` and, transitively, the source files of the modules it imports from `folders` or the `aoc` package.
+    """
+    found: Set[Path] = set()
+    pending = [path]
+    while pending:
+        path = pending.pop()
+        if path not in found:
+            found.add(path)
+            pending.extend(dependencies(path, folders))
+    return sorted(found)
+
+
+def dependencies(path: Path, folders: Sequence[Path]) -> Tuple[Path, ...]:
+    """
+    Returns the source files of the modules imported by `path` that could be found.
+    They are looked up once per version of the file, since long-running processes look them up on every solve.
+    """
+    stat = path.stat()
+    return _dependencies(path, tuple(folders), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _dependencies(path: Path, folders: Tuple[Path, ...], mtime_ns: int, size: int) -> Tuple[Path, ...]:
+    return tuple(imported_sources(path, folders))
+
+
+def imported_sources(path: Path, folders: Sequence[Path]) -> Iterator[Path]:
+    """
+    Yields the source files of the modules imported by `path` that could be found.
+    `from package import name` may import a module, so `package.name` is looked up too.
+    """
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module.split(".") if node.module else []
+            names = [module, *(module + [alias.name] for alias in node.names)]
+            if node.level:
+                base = path.parents[node.level - 1]
+                yield from filter(None, (source_file(base, Path(*name)) for name in names if name))
+                continue
+            names = [".".join(name) for name in names if name]
+        else:
+            continue
+        yield from filter(None, (resolve(name, folders) for name in names))
+
+
+def resolve(name: str, folders: Sequence[Path]) -> Optional[Path]:
+    """
+    Finds the source file of module `name` if it belongs to the repository or to `aoc`.
+    Only the parent packages of `aoc` modules get imported to do so.
+    """
+    for folder in folders:
+        source = source_file(folder, Path(*name.split(".")))
+        if source is not None:
+            return source
+    if name == "aoc" or name.startswith("aoc."):
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            return None
+        if spec is not None and spec.origin and spec.origin.endswith(".py"):
+            return Path(spec.origin)
+    return None
+
+
+def source_file(folder: Path, module: Path) -> Optional[Path]:
+    for candidate in (folder / module.with_suffix(".py"), folder / module / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
@@ -0,0 +1,57 @@
+"""
+Batch mode: one day solver run over many input files.
+
+Inputs are dispatched to a process pool in chunks, so a worker imports the
+solver once and then goes through its chunk without a round trip per file.
+Results come back in input order, one JSON object per input.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from .days import Day, solve
+
+
+def run_batch(day: Day, inputs: Sequence[Path], jobs: Optional[int] = None, chunksize: Optional[int] = None,
+              cache: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Solves `day` on each of `inputs`, yielding one record per input in the same order.
+    `chunksize` defaults to spreading the inputs over about four chunks per worker.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(inputs) // (jobs * 4))
+    paths = [str(Path(path).resolve()) for path in inputs]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=preload, initargs=(day,)) as executor:
+        yield from executor.map(solve_input, [day] * len(paths), paths, [cache] * len(paths), chunksize=chunksize)
+
+
+def preload(day: Day) -> None:
+    try:
+        day.load()
+    except Exception:
+        pass  # Reported for every input by `solve`.
+
+
+def solve_input(day: Day, path: str, cache: bool = False) -> Dict[str, Any]:
+    solution = solve(day, path, cache=cache)
+    return {
+        "input": path,
+        "answers": solution.answers,
+        "timings": solution.timings,
+        "error": solution.error,
+    }
+
+
+def to_json_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, default=json_value)
+
+
+def json_value(value: Any) -> Any:
+    """
+    Converts answers JSON does not know about: NumPy scalars become Python numbers, anything else its string.
+    """
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
@@ -0,0 +1,96 @@
+"""
+Benchmark harness for the daily solvers.
+"""
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .days import Day, solve
+from .puzzle import PHASES
+
+
+@dataclass
+class BenchResult:
+    day: Day
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    """
+    Timed samples for each phase and for the whole run (`total`), in seconds.
+    """
+    error: Optional[str] = None
+
+    def stats(self, phase: str = "total") -> Dict[str, float]:
+        return summarize(self.samples.get(phase, []))
+
+    def to_dict(self) -> dict:
+        return {
+            "year": self.day.year,
+            "day": self.day.day,
+            "module": self.day.path.stem,
+            "error": self.error,
+            "iterations": len(self.samples.get("total", [])),
+            "phases": {phase: self.stats(phase) for phase in self.samples},
+        }
+
+
+def benchmark(day: Day, filename: str = "input.txt", warmup: int = 1, iterations: int = 5, cache: bool = False) -> BenchResult:
+    """
+    Runs `warmup` untimed iterations of `day`, then collects `iterations` timed samples.
+    Stops at the first failing iteration.
+    """
+    result = BenchResult(day=day)
+    for iteration in range(warmup + iterations):
+        solution = solve(day, filename, cache=cache)
+        if solution.error is not None:
+            result.error = solution.error
+            break
+        if iteration < warmup:
+            continue
+        for phase, elapsed in solution.timings.items():
+            result.samples.setdefault(phase, []).append(elapsed)
+        result.samples.setdefault("total", []).append(solution.total_time)
+    return result
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Computes min/median/p95 over `samples`.
+    """
+    if not samples:
+        return {}
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+    }
+
+
+def percentile(samples: Sequence[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def format_table(results: Sequence[BenchResult]) -> str:
+    """
+    Formats `results` as a plain-text table (times in milliseconds).
+    """
+    header = ["day", "module", "min", "median", "p95", *PHASES]
+    rows = [header]
+    for result in filter(lambda result: result.error is None, results):
+        total = result.stats()
+        rows.append([
+            result.day.name,
+            result.day.path.stem,
+            *(f"{total[key] * 1000:.2f}" for key in ("min", "median", "p95")),
+            *(f"{result.stats(phase)['median'] * 1000:.2f}" if phase in result.samples else "-" for phase in PHASES),
+        ])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+    lines += [f"{result.day.name}  {result.day.path.stem}  ERROR {result.error}" for result in results if result.error is not None]
+    return "\n".join(lines)
+
+
+def write_json(results: Sequence[BenchResult], path: Path) -> None:
+    path.write_text(json.dumps([result.to_dict() for result in results], indent=2))
@@ -0,0 +1,207 @@
+"""
+Bounded, instrumented memoization for solver functions.
+
+`@cache(maxsize, policy)` works like `functools.lru_cache`, with a choice of
+eviction policy (least recently or least frequently used) and counters of hits,
+misses and evictions. Every cache registers itself, so that the runner can
+report how each one behaved while solving a day.
+"""
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+LRU = "lru"
+LFU = "lfu"
+
+_MISSING = object()
+
+_KWARGS_MARK = object()
+"""
+Separates positional from keyword arguments in cache keys, so that `f(1, x=2)` and `f(1, ("x", 2))` differ.
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def since(self, before: "CacheStats") -> "CacheStats":
+        """
+        Returns the counts accumulated after `before` was taken, with the current size.
+        """
+        return replace(self, hits=self.hits - before.hits, misses=self.misses - before.misses,
+                       evictions=self.evictions - before.evictions)
+
+
+class LRUStore:
+    """
+    Evicts the least recently used entry.
+    """
+
+    def __init__(self):
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self.entries[key] = value
+
+    def evict(self) -> None:
+        self.entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class LFUStore:
+    """
+    Evicts the least frequently used entry, the least recently used one among ties; every operation is O(1).
+    """
+
+    def __init__(self):
+        self.entries: Dict[Hashable, Any] = {}
+        self.frequencies: Dict[Hashable, int] = {}
+        self.buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        """
+        Keys by use count, each in order of last use.
+        """
+        self.min_frequency = 0
+
+    def get(self, key: Hashable) -> Any:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            frequency = self.frequencies[key]
+            self._unlink(key, frequency)
+            if self.min_frequency == frequency and frequency not in self.buckets:
+                self.min_frequency = frequency + 1
+            self._link(key, frequency + 1)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if key in self.entries:
+            self.entries[key] = value
+            return
+        self.entries[key] = value
+        self._link(key, 1)
+        self.min_frequency = 1
+
+    def evict(self) -> None:
+        # Only called right before `put`, which resets `min_frequency` to 1: it is not recomputed here.
+        key, _ = self.buckets[self.min_frequency].popitem(last=False)
+        if not self.buckets[self.min_frequency]:
+            del self.buckets[self.min_frequency]
+        del self.entries[key], self.frequencies[key]
+
+    def _link(self, key: Hashable, frequency: int) -> None:
+        self.frequencies[key] = frequency
+        self.buckets.setdefault(frequency, OrderedDict())[key] = None
+
+    def _unlink(self, key: Hashable, frequency: int) -> None:
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+STORES = {LRU: LRUStore, LFU: LFUStore}
+
+CACHES: Dict[str, Callable] = {}
+"""
+Every cached function, by module and qualified name.
+"""
+
+
+def cache(maxsize: Optional[int] = 128, policy: str = LRU, name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Memoizes a function on its (hashable) arguments, keeping at most `maxsize` results (all of them if `None`)
+    and evicting by `policy`. The decorated function gets `stats()` and `cache_clear()`.
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError(f"A cache must hold at least one result, got maxsize={maxsize}")
+    if policy not in STORES:
+        raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {', '.join(STORES)}")
+
+    def decorate(func: F) -> F:
+        store = STORES[policy]()
+        stats = CacheStats(maxsize=maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs else (*args, _KWARGS_MARK, *sorted(kwargs.items()))
+            value = store.get(key)
+            if value is not _MISSING:
+                stats.hits += 1
+                return value
+            stats.misses += 1
+            value = func(*args, **kwargs)
+            if maxsize is not None and len(store) >= maxsize and key not in store:
+                store.evict()
+                stats.evictions += 1
+            store.put(key, value)
+            return value
+
+        def current_stats() -> CacheStats:
+            return replace(stats, size=len(store))
+
+        def cache_clear() -> None:
+            nonlocal store
+            store = STORES[policy]()
+
+        wrapper.stats = current_stats
+        wrapper.cache_clear = cache_clear
+        CACHES[name or f"{func.__module__}.{func.__qualname__}"] = wrapper
+        return wrapper
+    return decorate
+
+
+def clear() -> None:
+    """
+    Empties every cache, keeping their statistics.
+    """
+    for cached in CACHES.values():
+        cached.cache_clear()
+
+
+def snapshot() -> Dict[str, CacheStats]:
+    """
+    Returns the current statistics of every cache.
+    """
+    return {cache_name: cached.stats() for cache_name, cached in CACHES.items()}
+
+
+def used_since(before: Dict[str, CacheStats]) -> Dict[str, CacheStats]:
+    """
+    Returns the statistics of the caches called since the `before` snapshot, counting only the calls after it.
+    """
+    used = {}
+    for cache_name, stats in snapshot().items():
+        stats = stats.since(before.get(cache_name, CacheStats()))
+        if stats.hits or stats.misses:
+            used[cache_name] = stats
+    return used
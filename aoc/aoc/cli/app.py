@@ -1,15 +1,401 @@
+import contextlib
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
 import typer
-from .prep import prep_today
 
+from ..days import PARTS, discover_days
+
+# Command implementations are imported by each command, so that starting the CLI stays cheap.
 app = typer.Typer()
 
 
 @app.command()
-def prep():
+def prep(
+    year: Optional[str] = typer.Option(None, help="Prepare days of this year instead of today."),
+    days: Optional[str] = typer.Option(None, help="Days to prepare, like 1-5,8 (defaults to the whole year)."),
+    jobs: int = typer.Option(8, help="Concurrent downloads."),
+    base_url: Optional[str] = typer.Option(None, help="Site to fetch puzzles from (defaults to $AOC_BASE_URL or adventofcode.com)."),
+):
+    """
+    Prepares for a new day of AOC, or for a range of days of a year.
+    """
+    from .prep import BASE_URL, parse_days, prep_days, prep_today
+
+    if year is None and days is None:
+        if prep_today(base_url or BASE_URL):
+            raise typer.Exit(code=1)
+        return
+    if year is None:
+        raise typer.BadParameter("Pass --year to prepare a range of days.")
+    try:
+        selected = parse_days(days)
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex))
+    if prep_days(year, selected, base_url=base_url or BASE_URL, jobs=jobs):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def bench(
+    year: List[str] = typer.Option([], help="Only benchmark these years."),
+    day: List[str] = typer.Option([], help="Only benchmark these days."),
+    input_file: str = typer.Option("input.txt", help="Input file name inside each day folder."),
+    warmup: int = typer.Option(1, help="Untimed iterations before measuring."),
+    iterations: int = typer.Option(5, help="Timed iterations per day."),
+    output: Path = typer.Option(Path("bench.json"), help="Where to write the JSON report."),
+    cache: bool = typer.Option(False, help="Load parsed inputs from the parse cache."),
+    record: bool = typer.Option(True, help="Record the samples in the benchmark history."),
+    history_file: Optional[Path] = typer.Option(None, help="Benchmark history database (defaults to the cache directory)."),
+):
+    """
+    Benchmarks every day solver, reporting min/median/p95 wall times.
+    """
+    from .. import bench as benchmarks
+    from ..history import HISTORY_PATH, record as record_run
+
+    results = []
+    for puzzle_day in discover_days(years=year, days=day):
+        typer.echo(f"Benchmarking {puzzle_day.name}...", err=True)
+        results.append(benchmarks.benchmark(puzzle_day, input_file, warmup=warmup, iterations=iterations, cache=cache))
+    typer.echo(benchmarks.format_table(results))
+    benchmarks.write_json(results, output)
+    if record:
+        run = record_run(results, input_file, history_file or HISTORY_PATH)
+        typer.echo(f"Recorded run {run.describe()}", err=True)
+
+
+@app.command()
+def bench_history(
+    limit: int = typer.Option(20, help="How many runs to list."),
+    history_file: Optional[Path] = typer.Option(None, help="Benchmark history database (defaults to the cache directory)."),
+):
+    """
+    Lists the benchmark runs in the history, most recent first.
+    """
+    from ..history import HISTORY_PATH, list_runs
+
+    for run in list_runs(history_file or HISTORY_PATH, limit=limit):
+        typer.echo(run.describe())
+
+
+@app.command()
+def bench_compare(
+    baseline: Optional[str] = typer.Option(None, help="Run id or commit to compare against (defaults to the previous comparable run)."),
+    candidate: Optional[str] = typer.Option(None, help="Run id or commit to check (defaults to the latest run)."),
+    alpha: float = typer.Option(0.05, help="Significance level of the Mann-Whitney U test."),
+    threshold: float = typer.Option(0.1, help="Minimum relative growth of the median to report."),
+    min_delta: float = typer.Option(1.0, help="Minimum absolute growth of the median to report (ms)."),
+    history_file: Optional[Path] = typer.Option(None, help="Benchmark history database (defaults to the cache directory)."),
+):
+    """
+    Compares two benchmark runs per day and phase, failing on significant slowdowns.
+    """
+    from ..history import HISTORY_PATH, compare, find_run, format_comparisons, list_runs, previous_comparable
+
+    history_file = history_file or HISTORY_PATH
+    if candidate is None:
+        latest = list_runs(history_file, limit=1)
+        candidate_run = latest[0] if latest else None
+    else:
+        candidate_run = find_run(candidate, history_file)
+    if candidate_run is None:
+        raise typer.BadParameter("No candidate run found in the benchmark history.")
+    baseline_run = previous_comparable(candidate_run, history_file) if baseline is None else find_run(baseline, history_file)
+    if baseline_run is None:
+        raise typer.BadParameter("No baseline run found in the benchmark history.")
+    typer.echo(f"baseline:  {baseline_run.describe()}")
+    typer.echo(f"candidate: {candidate_run.describe()}")
+    comparisons = compare(baseline_run, candidate_run, alpha=alpha, threshold=threshold, min_delta=min_delta / 1000,
+                          path=history_file)
+    typer.echo(format_comparisons(comparisons))
+    slower = [comparison for comparison in comparisons if comparison.slower]
+    if slower:
+        typer.echo(f"{len(slower)} significant slowdowns", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def run(
+    all_days: bool = typer.Option(False, "--all", help="Run every day of every year."),
+    year: List[str] = typer.Option([], help="Only run these years."),
+    day: List[str] = typer.Option([], help="Only run these days."),
+    input_file: str = typer.Option("input.txt", help="Input file name inside each day folder."),
+    jobs: Optional[int] = typer.Option(None, help="Worker processes (defaults to the number of CPUs)."),
+    cache: bool = typer.Option(True, help="Load parsed inputs from the parse cache."),
+    memory: bool = typer.Option(False, help="Report peak memory per phase (slows solvers down)."),
+    memo: bool = typer.Option(True, help="Reuse the answers of days whose solver and input are unchanged."),
+    server: bool = typer.Option(True, help="Send work to the aoc serve daemon, when it is running."),
+    spans: Optional[Path] = typer.Option(None, help="Record the spans marked by solvers and write them to this JSON file."),
+    time_limit: Optional[float] = typer.Option(None, help="Stop days running for longer than this (seconds)."),
+    memory_limit: Optional[int] = typer.Option(None, help="Stop days using more memory than this (MiB)."),
+):
+    """
+    Runs day solvers in parallel, printing answers as each day finishes.
+    """
+    from ..runner import format_solution, run_days, write_spans
+    from ..server import running_socket
+
+    if not (all_days or year or day):
+        raise typer.BadParameter("Pass --all or select days with --year/--day.")
+    limits = None
+    if time_limit is not None or memory_limit is not None:
+        from ..limits import Limits
+
+        limits = Limits(time=time_limit, memory=memory_limit << 20 if memory_limit is not None else None)
+    start = time.perf_counter()
+    solutions = []
+    for solution in run_days(discover_days(years=year, days=day), input_file, jobs=jobs, cache=cache,
+                             trace_memory=memory, memo=memo and not memory and spans is None,
+                             server=running_socket() if server and limits is None else None,
+                             record_spans=spans is not None, limits=limits):
+        typer.echo(format_solution(solution))
+        solutions.append(solution)
+    failures = sum(solution.error is not None for solution in solutions)
+    typer.echo(f"Done in {time.perf_counter() - start:.2f} s ({failures} failed)")
+    if spans is not None:
+        write_spans(solutions, spans)
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def batch(
+    year: str,
+    day: str,
+    pattern: str = typer.Argument(..., help="Glob of the input files, like 'corpus/**/*.txt'."),
+    jobs: Optional[int] = typer.Option(None, help="Worker processes (defaults to the number of CPUs)."),
+    chunksize: Optional[int] = typer.Option(None, help="Inputs sent to a worker at a time (defaults to about four chunks per worker)."),
+    output: Optional[Path] = typer.Option(None, help="Write the JSON lines to this file instead of stdout."),
+    cache: bool = typer.Option(False, help="Load parsed inputs from the parse cache."),
+):
+    """
+    Runs one day solver over every input file matching PATTERN, writing one JSON line per input.
+    """
+    import glob
+
+    from ..batch import run_batch, to_json_line
+
+    days = discover_days(years=[year], days=[day])
+    if not days:
+        raise typer.BadParameter(f"No solver found for {year}/{day}.")
+    inputs = sorted(Path(path) for path in glob.glob(pattern, recursive=True))
+    if not inputs:
+        raise typer.BadParameter(f"No input files match {pattern}.")
+    failures = 0
+    with open(output, "w") if output is not None else contextlib.nullcontext(sys.stdout) as out:
+        for record in run_batch(days[0], inputs, jobs=jobs, chunksize=chunksize, cache=cache):
+            out.write(to_json_line(record) + "\n")
+            failures += record["error"] is not None
+    typer.echo(f"Solved {len(inputs)} inputs ({failures} failed)", err=True)
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def solve(
+    year: str,
+    day: str,
+    input_file: str = typer.Argument("-", help="Input file to solve, or '-' to read it from stdin."),
+):
+    """
+    Solves one day on a single input, streaming it from stdin by default: `cat input.txt | aoc solve 2022 01`.
+    """
+    from ..days import working_directory
+    from ..puzzle import Puzzle
+
+    days = discover_days(years=[year], days=[day])
+    if not days:
+        raise typer.BadParameter(f"No solver found for {year}/{day}.")
+    with open(input_file, "rb") if input_file != "-" else contextlib.nullcontext(sys.stdin.buffer) as stream:
+        with working_directory(days[0].workdir):
+            try:
+                Puzzle.of(days[0].load()).run(stream)
+            except Exception as exc:
+                typer.echo(f"{type(exc).__name__}: {exc}", err=True)
+                raise typer.Exit(code=1)
+
+
+@app.command()
+def compare(
+    year: str,
+    day: str,
+    part: List[str] = typer.Option([], help="Only compare the variants of these parts (part_one, part_two)."),
+    input_file: str = typer.Option("input.txt", help="Input file name inside the day folder."),
+    rounds: int = typer.Option(20, help="Timed calls of each implementation."),
+    confidence: float = typer.Option(0.95, help="Confidence level of the reported intervals."),
+):
+    """
+    Compares the registered variants of a day's parts with its reference solver: answers, speed and memory.
+    """
+    from ..puzzle import PARTS
+    from ..compare import compare_variants, format_comparisons
+
+    days = discover_days(years=[year], days=[day])
+    if not days:
+        raise typer.BadParameter(f"No solver found for {year}/{day}.")
+    comparisons = compare_variants(days[0], input_file, parts=part or PARTS, rounds=rounds, confidence=confidence)
+    if not comparisons:
+        typer.echo(f"No variants registered for {days[0].name}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(format_comparisons(days[0], comparisons))
+    disagreeing = [comparison for comparison in comparisons if not comparison.agrees]
+    if disagreeing:
+        typer.echo(f"{len(disagreeing)} variants do not agree with the reference", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def gen(
+    year: str,
+    day: str,
+    scale: int = typer.Option(10, help="How many times larger than input.txt the generated input is."),
+    seed: int = typer.Option(0, help="Random seed."),
+    output: Optional[Path] = typer.Option(None, help="Defaults to scaled_input_<scale>x.txt in the day folder."),
+):
+    """
+    Generates a synthetic input, SCALE times larger than the real one.
     """
-    Prepares for a new day of AOC.
+    from ..generators import generate_input
+
+    days = discover_days(years=[year], days=[day])
+    if not days:
+        raise typer.BadParameter(f"No solver found for {year}/{day}.")
+    output = output or days[0].input_path(f"scaled_input_{scale}x.txt")
+    typer.echo(generate_input(days[0], scale, output, seed=seed))
+
+
+@app.command()
+def profile(
+    year: str,
+    day: str,
+    input_file: str = typer.Option("input.txt", help="Input file name inside the day folder."),
+    part: List[int] = typer.Option([1, 2], min=1, max=2, help="Parts to solve."),
+    top: int = typer.Option(15, help="How many functions to report."),
+    pstats_output: Optional[Path] = typer.Option(None, "--pstats", help="Dump raw cProfile stats to this file."),
+    collapsed: Optional[Path] = typer.Option(None, help="Write sampled collapsed stacks (for flamegraphs) to this file."),
+):
     """
-    prep_today()
+    Profiles one day solver, reporting its hottest functions.
+    """
+    from ..profiling import format_report, profile_day
+    from ..runner import format_solution
+
+    days = discover_days(years=[year], days=[day])
+    if not days:
+        raise typer.BadParameter(f"No solver found for {year}/{day}.")
+    stats, solution = profile_day(days[0], input_file, parts=[PARTS[p - 1] for p in part], collapsed=collapsed)
+    typer.echo(format_solution(solution))
+    typer.echo(format_report(stats, limit=top))
+    if pstats_output is not None:
+        stats.dump_stats(pstats_output)
+
+
+@app.command()
+def watch(
+    year: List[str] = typer.Option([], help="Only watch these years."),
+    day: List[str] = typer.Option([], help="Only watch these days."),
+    input_file: str = typer.Option("input.txt", help="Input file name inside each day folder."),
+    interval: float = typer.Option(0.5, help="Seconds between checks for changes."),
+):
+    """
+    Keeps a warm interpreter running, re-running each day when its solver or input changes.
+    """
+    from ..runner import format_solution
+    from ..watch import preload, watch as watch_days
+
+    days = discover_days(years=year, days=day)
+    if not days:
+        raise typer.BadParameter("No solver found.")
+    typer.echo(f"Preloaded {', '.join(preload()) or 'nothing'}", err=True)
+    for puzzle_day in days:
+        try:
+            puzzle_day.load()
+        except Exception as ex:
+            typer.echo(f"{puzzle_day.name}  could not be imported: {type(ex).__name__}: {ex}", err=True)
+    typer.echo(f"Watching {len(days)} days, press Ctrl+C to stop.", err=True)
+    try:
+        for solution in watch_days(days, input_file, interval=interval,
+                                   on_change=lambda changed: typer.echo(f"{changed.name} changed, re-running...", err=True)):
+            typer.echo(format_solution(solution))
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def serve(
+    preload_days: bool = typer.Option(True, help="Import every day solver up front, not just the shared libraries."),
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Unix socket to listen on."),
+):
+    """
+    Runs a daemon that solves days in forked workers of a preloaded interpreter, for aoc run to use.
+    """
+    from ..server import SOCKET_PATH, is_running, serve as serve_forever
+
+    socket_path = socket_path or SOCKET_PATH
+    if is_running(socket_path):
+        typer.echo(f"A daemon is already listening on {socket_path}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Listening on {socket_path}, press Ctrl+C to stop.", err=True)
+    try:
+        serve_forever(discover_days() if preload_days else (), socket_path)
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def importtime(
+    year: List[str] = typer.Option([], help="Only check these years."),
+    day: List[str] = typer.Option([], help="Only check these days."),
+    cli: bool = typer.Option(True, help="Check the import time of the aoc CLI too."),
+    budget: float = typer.Option(200.0, help="Maximum import time of each module (ms)."),
+):
+    """
+    Checks the import time of the CLI and of every day solver (with python -X importtime) against a budget.
+    """
+    from ..importtime import format_import_times, measure_cli, measure_day
+
+    results = [measure_cli()] if cli else []
+    results.extend(measure_day(puzzle_day) for puzzle_day in discover_days(years=year, days=day))
+    typer.echo(format_import_times(results, budget / 1000))
+    if not all(result.within(budget / 1000) for result in results):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def scaling(
+    case: List[str] = typer.Option([], help="Only check the cases whose name contains one of these."),
+    tolerance: float = typer.Option(0.3, help="How far the fitted exponent may exceed the declared one."),
+    base_size: int = typer.Option(0, help="Smallest input size, in the unit of each case (default: its own)."),
+):
+    """
+    Times solver functions on inputs of size n, 2n, 4n and 8n, and fails if they grow faster than their declared complexity.
+    """
+    from ..scaling import CASES, format_results, measure
+
+    selected = [scaling_case for name, scaling_case in CASES.items() if not case or any(part in name for part in case)]
+    results = []
+    for scaling_case in selected:
+        results.append(measure(scaling_case, base_size=base_size))
+        typer.echo(format_results(results[-1:], tolerance))
+    if not all(result.within(tolerance) for result in results):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def microbench(
+    size: int = typer.Option(100_000, help="Number of input elements."),
+    repeat: int = typer.Option(5, help="Timed repetitions of each implementation."),
+):
+    """
+    Times the shared iteration helpers against the per-day implementations they replaced.
+    """
+    from ..microbench import BENCHMARKS, format_results, measure
+
+    typer.echo(format_results([measure(benchmark, size, repeat) for benchmark in BENCHMARKS]))
+
 
 @app.command()
 def version():
@@ -1,28 +1,81 @@
 """
 Yes, I'm that lazy.
 """
+import os
 import re
 import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Tuple
-import urllib.request
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from markdownify import markdownify as md
+from ..fetch import Fetcher
 
 
-def prep_today():
+BASE_URL = os.environ.get("AOC_BASE_URL", "https://adventofcode.com")
+
+
+def prep_today(base_url: str = BASE_URL) -> Dict[str, str]:
     """
     Create folder for today's puzzle
     """
     year, day = get_year_and_day()
-    folder = create_puzzle_folder(year, day)
-    aoc_puzzle = get_aoc_puzzle(year, day)
+    return prep_days(year, [day], base_url=base_url)
 
-    create_readme(folder, aoc_puzzle)
-    create_python_file(folder, aoc_puzzle)
-    create_input_files(folder)
 
-    print('Done.')
+def prep_days(year: str, days: Sequence[str], base_url: str = BASE_URL, jobs: int = 8) -> Dict[str, str]:
+    """
+    Create folders for the puzzles of `days`, fetching them concurrently.
+    Days whose folder already exists are skipped. A day that cannot be fetched (not released yet, or a network error)
+    does not stop the others: the failures are returned, with their error, once every other day is prepared.
+    """
+    pending = []
+    for day in days:
+        if Path(f"aoc_{year}", f"day{day}").exists():
+            print(f"Skipping {year}/{day}: folder already exists")
+        else:
+            pending.append(day)
+
+    puzzles, failures = {}, {}
+    fetcher = Fetcher()
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(get_aoc_puzzle, year, day, base_url, fetcher): day for day in pending}
+            for future in as_completed(futures):
+                try:
+                    puzzles[futures[future]] = future.result()
+                except Exception as ex:
+                    failures[futures[future]] = f"{type(ex).__name__}: {ex}"
+    finally:
+        fetcher.close()
+
+    for day in pending:
+        if day in failures:
+            print(f"Failed to prepare {year}/{day}: {failures[day]}")
+            continue
+        aoc_puzzle = puzzles[day]
+        folder = create_puzzle_folder(year, day)
+        create_readme(folder, aoc_puzzle)
+        create_python_file(folder, aoc_puzzle)
+        create_input_files(folder)
+        print(f"Prepared {year}/{day}: {get_puzzle_title(aoc_puzzle)}")
+
+    print(f"Done ({len(failures)} failed)." if failures else 'Done.')
+    return failures
+
+
+def parse_days(spec: Optional[str]) -> List[str]:
+    """
+    Parses a day selection like `1-5,8` into formatted days; no selection means all 25 days.
+    """
+    if not spec:
+        return [f"{day:02d}" for day in range(1, 26)]
+    days = []
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        days.extend(f"{day:02d}" for day in range(int(first), int(last or first) + 1))
+    if not all(1 <= int(day) <= 25 for day in days):
+        raise ValueError(f"Days must be between 1 and 25: {spec}")
+    return days
 
 
 def get_year_and_day() -> Tuple[str, str]:
@@ -43,24 +96,25 @@ def create_puzzle_folder(year: str, day: str):
     return puzzle_folder
 
 
-def get_aoc_puzzle(year: str, day: str) -> str:
+def get_aoc_puzzle(year: str, day: str, base_url: str = BASE_URL, fetcher: Optional[Fetcher] = None) -> str:
     """
     Reads the puzzle from AOC site.
     """
+    from markdownify import markdownify as md
+
     day_number = day.lstrip('0')
-    url = f"https://adventofcode.com/{year}/day/{day_number}"
-    html_text = read_url(url)
+    url = f"{base_url.rstrip('/')}/{year}/day/{day_number}"
+    html_text = read_url(url, fetcher)
     start = html_text.index(f'<h2>--- Day {day_number}')
-    end = html_text.index('</article>\\n')
-    return md(html_text[start:end].replace('\\n', '\n'))
+    end = html_text.index('</article>\n')
+    return md(html_text[start:end])
 
 
-def read_url(url: str) -> str:
+def read_url(url: str, fetcher: Optional[Fetcher] = None) -> str:
     """
-    Reads an URL.
+    Reads an URL, through the HTTP cache.
     """
-    with urllib.request.urlopen(url) as page:
-        return str(page.read())
+    return (fetcher or Fetcher()).get(url).text
 
 
 def create_readme(folder: Path, aoc_puzzle: str):
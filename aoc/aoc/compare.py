@@ -0,0 +1,194 @@
+"""
+Comparison of the variants of a day's parts against the reference solver.
+
+`compare_variants` solves the same parsed input with the reference part and
+every variant registered with `aoc.variants.variant`, checks that their
+answers agree, and measures their relative speed and peak memory, with
+bootstrap confidence intervals over the repeated samples.
+"""
+import contextlib
+import io
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import cache
+from .days import Day, working_directory
+from .memory import format_size, track, tracing
+from .puzzle import PARTS, Puzzle
+from .variants import VARIANTS
+
+
+REFERENCE = "reference"
+"""
+Name of the part solver the day's puzzle is registered with.
+"""
+
+Interval = Tuple[float, float, float]
+"""
+A ratio of medians, with the lower and upper bounds of its confidence interval.
+"""
+
+
+def variants_of(module: ModuleType) -> Dict[str, Dict[str, Callable[[Any], Any]]]:
+    """
+    Returns the implementations of each part of `module` that has variants, the reference one first.
+    """
+    puzzle = Puzzle.of(module)
+    registered = VARIANTS.get(module.__name__, {})
+    unknown = set(registered) - set(PARTS)
+    if unknown:
+        raise ValueError(f"Variants of unknown parts {', '.join(sorted(unknown))}, expected one of {', '.join(PARTS)}")
+    return {
+        part: {REFERENCE: getattr(puzzle, part), **registered}
+        for part, registered in VARIANTS.get(module.__name__, {}).items()
+    }
+
+
+@dataclass
+class VariantRun:
+    name: str
+    answer: Any = None
+    times: List[float] = field(default_factory=list)
+    """
+    Wall time of each timed call, in seconds.
+    """
+    peaks: List[int] = field(default_factory=list)
+    """
+    Peak traced memory of each traced call, in bytes.
+    """
+    error: Optional[str] = None
+
+
+@dataclass
+class Comparison:
+    part: str
+    reference: VariantRun
+    candidate: VariantRun
+    speedup: Optional[Interval] = None
+    """
+    How many times faster the candidate is than the reference.
+    """
+    memory: Optional[Interval] = None
+    """
+    Peak memory of the candidate relative to the reference.
+    """
+
+    @property
+    def agrees(self) -> bool:
+        return self.reference.error is None and self.candidate.error is None and self.reference.answer == self.candidate.answer
+
+
+def compare_variants(day: Day, filename: str = "input.txt", parts: Sequence[str] = PARTS, rounds: int = 20,
+                     memory_rounds: int = 3, confidence: float = 0.95) -> List[Comparison]:
+    """
+    Compares every variant of the parts of `day` with the reference solver, on `filename` parsed once.
+    Implementations are timed in interleaved rounds, so that a drifting machine affects all of them alike,
+    with every `aoc.cache` cache emptied before each call; memory is traced in separate, untimed calls.
+    """
+    module = day.load()
+    puzzle = Puzzle.of(module)
+    implementations = variants_of(module)
+    comparisons = []
+    with working_directory(day.workdir), contextlib.redirect_stdout(io.StringIO()):
+        parsed = puzzle.parse(puzzle.read(day.input_path(filename)))
+        for part in parts:
+            if part not in implementations:
+                continue
+            runs = [VariantRun(name) for name in implementations[part]]
+            for run in runs:
+                profile(run, implementations[part][run.name], parsed, memory_rounds)
+            working = [run for run in runs if run.error is None]
+            for _ in range(rounds):
+                for run in working:
+                    cache.clear()
+                    start = time.perf_counter()
+                    implementations[part][run.name](parsed)
+                    run.times.append(time.perf_counter() - start)
+            reference, candidates = runs[0], runs[1:]
+            comparisons.extend(compare_runs(part, reference, candidate, confidence) for candidate in candidates)
+    return comparisons
+
+
+def profile(run: VariantRun, implementation: Callable[[Any], Any], parsed: Any, memory_rounds: int) -> None:
+    """
+    Records the answer of an implementation, which also warms it up, and its peak memory.
+    """
+    try:
+        cache.clear()
+        run.answer = implementation(parsed)
+        with tracing():
+            for _ in range(memory_rounds):
+                cache.clear()
+                with track() as usage:
+                    implementation(parsed)
+                run.peaks.append(usage.peak)
+    except Exception as ex:
+        run.error = f"{type(ex).__name__}: {ex}"
+
+
+def compare_runs(part: str, reference: VariantRun, candidate: VariantRun, confidence: float) -> Comparison:
+    comparison = Comparison(part=part, reference=reference, candidate=candidate)
+    if reference.times and candidate.times:
+        comparison.speedup = ratio_interval(reference.times, candidate.times, confidence)
+    if reference.peaks and candidate.peaks:
+        # A part allocating next to nothing would make the ratio meaningless, so peaks count from one byte.
+        comparison.memory = ratio_interval([max(peak, 1) for peak in candidate.peaks],
+                                           [max(peak, 1) for peak in reference.peaks], confidence)
+    return comparison
+
+
+def ratio_interval(numerators: Sequence[float], denominators: Sequence[float], confidence: float = 0.95,
+                   resamples: int = 2000, seed: int = 0) -> Interval:
+    """
+    Returns the ratio of the medians of two samples, with a percentile bootstrap confidence interval.
+    """
+    rng = random.Random(seed)
+    ratios = sorted(
+        statistics.median(rng.choices(numerators, k=len(numerators)))
+        / statistics.median(rng.choices(denominators, k=len(denominators)))
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    lower = ratios[int(tail * (resamples - 1))]
+    upper = ratios[int((1 - tail) * (resamples - 1))]
+    return statistics.median(numerators) / statistics.median(denominators), lower, upper
+
+
+def format_comparisons(day: Day, comparisons: Sequence[Comparison]) -> str:
+    """
+    Formats the reference and each variant of every part, with the median time and peak memory of each,
+    then the speedup and relative memory of the variants, marking those whose answers differ.
+    """
+    lines = []
+    reference = None
+    for comparison in comparisons:
+        if comparison.reference is not reference:
+            reference = comparison.reference
+            lines.append(f"{day.name} {comparison.part}")
+            lines.append(format_run(reference))
+        line = format_run(comparison.candidate)
+        if comparison.speedup is not None:
+            line += f"  speed {format_interval(comparison.speedup)}"
+        if comparison.memory is not None:
+            line += f"  memory {format_interval(comparison.memory)}"
+        if not comparison.agrees and comparison.candidate.error is None:
+            line += "  DIFFERS"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_run(run: VariantRun) -> str:
+    if run.error is not None:
+        return f"  {run.name:<20} ERROR {run.error}"
+    median = statistics.median(run.times) * 1000 if run.times else float("nan")
+    peak = format_size(statistics.median(run.peaks)) if run.peaks else "-"
+    return f"  {run.name:<20} {median:9.2f} ms  peak {peak:>10}  answer {run.answer}"
+
+
+def format_interval(interval: Interval) -> str:
+    ratio, lower, upper = interval
+    return f"x{ratio:.2f} [{lower:.2f}, {upper:.2f}]"
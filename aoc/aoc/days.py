@@ -0,0 +1,182 @@
+"""
+Discovery and execution of the daily puzzle solvers.
+
+Every day module registers a `PUZZLE` entry point like the day template, or
+exposes the same functions: `parse_puzzle_lines`, `solve_part_one` and
+`solve_part_two`, plus an optional `read_puzzle_lines` (defaults to the raw
+lines of the memory-mapped input).
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .cache import CacheStats, snapshot, used_since
+from .memory import MemoryUsage, track, tracing
+from .puzzle import PARTS, Puzzle
+from .spans import SpanStats, recording, span
+
+
+YEAR_GLOB = "aoc_[0-9][0-9][0-9][0-9]"
+DAY_GLOB = "day[0-9][0-9]"
+
+
+@dataclass(frozen=True)
+class Day:
+    year: str
+    day: str
+    path: Path
+    """
+    Path of the solver module.
+    """
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day}"
+
+    @property
+    def folder(self) -> Path:
+        return self.path.parent
+
+    @property
+    def workdir(self) -> Path:
+        """
+        Directory solvers are run from (2021 days open files relative to it).
+        """
+        return self.folder.parent
+
+    def input_path(self, filename: str = "input.txt") -> Path:
+        return self.folder / filename
+
+    @property
+    def module_name(self) -> str:
+        """
+        Name the solver module is imported as (flat, so that it can be pickled by worker processes).
+        """
+        return f"aoc_{self.year}_day{self.day}_{self.path.stem}"
+
+    def load(self) -> ModuleType:
+        """
+        Imports the solver module.
+        """
+        if self.module_name in sys.modules:
+            return sys.modules[self.module_name]
+        spec = importlib.util.spec_from_file_location(self.module_name, self.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[self.module_name] = module
+        try:
+            with working_directory(self.workdir):
+                spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[self.module_name]
+            raise
+        return module
+
+
+@dataclass
+class Solution:
+    day: Day
+    answers: Dict[str, Any] = field(default_factory=dict)
+    """
+    Answer for each part.
+    """
+    timings: Dict[str, float] = field(default_factory=dict)
+    """
+    Wall time of each phase, in seconds.
+    """
+    memory: Dict[str, MemoryUsage] = field(default_factory=dict)
+    """
+    Memory used by each phase, when traced.
+    """
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    """
+    Time spent in each span, by path, when recorded; the phases are the outermost spans.
+    """
+    caches: Dict[str, CacheStats] = field(default_factory=dict)
+    """
+    Statistics of the `aoc.cache` caches called while solving, by name.
+    """
+    error: Optional[str] = None
+    limit: Optional[str] = None
+    """
+    Budget the day went over (`time` or `memory`) when it was run with limits; None otherwise.
+    """
+    memoized: bool = False
+    """
+    Whether the answers were reused from the answers store instead of being solved.
+    """
+    sources: Optional[str] = None
+    """
+    Digest of the solver sources the day was solved with, when solved by the `aoc serve` daemon.
+    """
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+
+def discover_days(root: Path = Path("."), years: Sequence[str] = (), days: Sequence[str] = ()) -> List[Day]:
+    """
+    Finds solver modules under `aoc_YYYY/dayNN` folders, optionally filtered by year and day.
+    """
+    found = []
+    for year_folder in sorted(root.resolve().glob(YEAR_GLOB)):
+        year = year_folder.name[len("aoc_"):]
+        if years and year not in years:
+            continue
+        for day_folder in sorted(year_folder.glob(DAY_GLOB)):
+            day = day_folder.name[len("day"):]
+            if days and day not in days and day.lstrip("0") not in days:
+                continue
+            modules = [path for path in sorted(day_folder.glob("*.py")) if path.name != "__init__.py"]
+            if modules:
+                found.append(Day(year=year, day=day, path=modules[0]))
+    return found
+
+
+def solve(day: Day, filename: str = "input.txt", parts: Sequence[str] = PARTS, cache: bool = False,
+          trace_memory: bool = False, record_spans: bool = False) -> Solution:
+    """
+    Solves `day` on `filename`, timing each phase.
+    Errors are reported in the solution instead of being raised, and the solver's own output is discarded.
+    If `cache` is set, parsed inputs are loaded from (and stored to) the parse cache.
+    If `trace_memory` is set, the memory used by each phase is measured too (slowing every phase down).
+    If `record_spans` is set, the spans marked by the solver are recorded too, nested in the phases.
+    """
+    solution = Solution(day=day)
+    caches_before = snapshot()
+    try:
+        module = day.load()
+        with working_directory(day.workdir), contextlib.redirect_stdout(io.StringIO()), \
+                tracing() if trace_memory else contextlib.nullcontext(), \
+                recording() if record_spans else contextlib.nullcontext() as spans:
+            for phase, step in Puzzle.of(module).phases(day.input_path(filename), parts, cache=cache):
+                with track() if trace_memory else contextlib.nullcontext() as usage, span(phase):
+                    start = time.perf_counter()
+                    result = step()
+                    solution.timings[phase] = time.perf_counter() - start
+                if usage is not None:
+                    solution.memory[phase] = usage
+                if phase in PARTS:
+                    solution.answers[phase] = result
+            solution.spans = spans or {}
+    except Exception as ex:
+        solution.error = f"{type(ex).__name__}: {ex}"
+    solution.caches = used_since(caches_before)
+    return solution
+
+
+@contextlib.contextmanager
+def working_directory(path: Path) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
@@ -0,0 +1,143 @@
+"""
+HTTP fetching with kept-alive connections and an on-disk cache.
+
+Cached responses are revalidated with conditional requests (`If-None-Match`
+and `If-Modified-Since`), so unchanged pages cost a 304 and no body.
+"""
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "http"
+
+USER_AGENT = "aoc-prep (https://github.com/rsayn/advent-of-code-2021)"
+
+
+class FetchError(Exception):
+    pass
+
+
+@dataclass
+class Response:
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+    cached: bool = False
+    """
+    Whether the body comes from the cache (after a 304 Not Modified).
+    """
+
+    @property
+    def text(self) -> str:
+        return self.body.decode()
+
+
+class Fetcher:
+    """
+    Fetches URLs over one kept-alive connection per thread and host, caching responses in `cache_dir`.
+    Safe to share between threads.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = CACHE_DIR, timeout: float = 30.0):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: List[http.client.HTTPConnection] = []
+
+    def get(self, url: str) -> Response:
+        """
+        Fetches `url`, revalidating the cached response if there is one; non-200 responses raise `FetchError`.
+        """
+        cached = self._load(url)
+        headers = {"User-Agent": USER_AGENT}
+        if cached is not None:
+            if "etag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["etag"]
+            if "last-modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["last-modified"]
+        response = self._request(url, headers)
+        if response.status == 304 and cached is not None:
+            cached.cached = True
+            return cached
+        if response.status != 200:
+            raise FetchError(f"GET {url} returned {response.status}")
+        self._store(url, response)
+        return response
+
+    def close(self) -> None:
+        """
+        Closes the connections opened by every thread.
+        """
+        with self._lock:
+            for connection in self._opened:
+                connection.close()
+            self._opened.clear()
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Response:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        try:
+            return self._send(self._connection(parts.scheme, parts.netloc), path, headers)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed a kept-alive connection: retry once on a new one.
+            self._local.connections.pop((parts.scheme, parts.netloc)).close()
+            return self._send(self._connection(parts.scheme, parts.netloc), path, headers)
+
+    @staticmethod
+    def _send(connection: http.client.HTTPConnection, path: str, headers: Dict[str, str]) -> Response:
+        connection.request("GET", path, headers=headers)
+        reply = connection.getresponse()
+        body = reply.read()
+        return Response(status=reply.status, body=body, headers={key.lower(): value for key, value in reply.getheaders()})
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        connections: Optional[Dict[Tuple[str, str], http.client.HTTPConnection]] = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        if (scheme, netloc) not in connections:
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise FetchError(f"Unsupported URL scheme: {scheme}")
+            connections[scheme, netloc] = connection
+            with self._lock:
+                self._opened.append(connection)
+        return connections[scheme, netloc]
+
+    def _entry(self, url: str) -> Path:
+        return self.cache_dir / hashlib.sha256(url.encode()).hexdigest()
+
+    def _load(self, url: str) -> Optional[Response]:
+        if self.cache_dir is None:
+            return None
+        entry = self._entry(url)
+        try:
+            headers = json.loads(entry.with_suffix(".json").read_text())
+            body = entry.with_suffix(".body").read_bytes()
+        except (OSError, ValueError):
+            return None
+        return Response(status=200, body=body, headers=headers)
+
+    def _store(self, url: str, response: Response) -> None:
+        if self.cache_dir is None:
+            return
+        entry = self._entry(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Validators go last, so an interrupted update at worst revalidates the new body with stale ones.
+        for suffix, payload in ((".body", response.body), (".json", json.dumps(response.headers).encode())):
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, delete=False) as tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, entry.with_suffix(suffix))
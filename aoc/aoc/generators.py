@@ -0,0 +1,391 @@
+"""
+Synthetic puzzle inputs, scaled up from the real ones.
+
+Each generator receives the real input lines of its day, a scale factor and a
+random generator, and yields the lines of a valid input roughly `scale` times
+larger. Grid days scale their area, so each side grows by `sqrt(scale)`.
+"""
+import math
+import random
+import string
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .days import Day
+
+
+Generator = Callable[[List[str], int, random.Random], Iterator[str]]
+
+GENERATORS: Dict[Tuple[str, str], Generator] = {}
+
+
+def generator(year: str, day: str) -> Callable[[Generator], Generator]:
+    """
+    Registers an input generator for `year`/`day`.
+    """
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+    return register
+
+
+def generate_input(day: Day, scale: int, output: Path, seed: int = 0) -> Path:
+    """
+    Writes an input for `day`, `scale` times larger than its `input.txt`, to `output`.
+    """
+    if (day.year, day.day) not in GENERATORS:
+        raise ValueError(f"No input generator for {day.name}")
+    real_lines = day.input_path().read_text().splitlines()
+    lines = GENERATORS[(day.year, day.day)](real_lines, scale, random.Random(seed))
+    with open(output, "w") as output_file:
+        for line in lines:
+            output_file.write(line)
+            output_file.write("\n")
+    return output
+
+
+def scaled_side(real_side: int, scale: int) -> int:
+    return max(1, round(real_side * math.sqrt(scale)))
+
+
+def digit_grid(real_lines: List[str], scale: int, rng: random.Random, digits: str = string.digits, square: bool = False) -> Iterator[str]:
+    rows, cols = scaled_side(len(real_lines), scale), scaled_side(len(real_lines[0]), scale)
+    if square:
+        rows = cols = max(rows, cols)
+    for _ in range(rows):
+        yield "".join(rng.choices(digits, k=cols))
+
+
+# --- 2021 ---------------------------------------------------------------------
+
+
+@generator("2021", "01")
+def sonar_sweep(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    depth = int(real_lines[0])
+    for _ in range(len(real_lines) * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        yield str(depth)
+
+
+@generator("2021", "02")
+def dive(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    # Going up never rises above the surface, so the depth (and the aim of part two) stays non-negative.
+    depth = 0
+    for _ in range(len(real_lines) * scale):
+        command = rng.choice(["forward", "down", "up"] if depth else ["forward", "down"])
+        amount = rng.randint(1, min(9, depth) if command == "up" else 9)
+        depth += {"down": amount, "up": -amount}.get(command, 0)
+        yield f"{command} {amount}"
+
+
+@generator("2021", "03")
+def binary_diagnostic(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    # Readings must be unique for the life support rating to converge to one value.
+    count = len(real_lines) * scale
+    width = max(len(real_lines[0]), count.bit_length() + 1)
+    for value in rng.sample(range(2 ** width), count):
+        yield f"{value:0{width}b}"
+
+
+@generator("2021", "04")
+def giant_squid(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    numbers = list(map(int, real_lines[0].split(",")))
+    board_count = sum(1 for line in real_lines[1:] if not line.strip()) * scale
+    yield ",".join(map(str, rng.sample(numbers, len(numbers))))
+    for _ in range(board_count):
+        yield ""
+        board = rng.sample(numbers, 25)
+        for row in range(5):
+            yield " ".join(f"{number:2d}" for number in board[row * 5:row * 5 + 5])
+
+
+@generator("2021", "05")
+def hydrothermal_venture(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    size = 1000
+    for _ in range(len(real_lines) * scale):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        match rng.choice(["horizontal", "vertical", "diagonal"]):
+            case "horizontal":
+                x2, y2 = rng.randrange(size), y1
+            case "vertical":
+                x2, y2 = x1, rng.randrange(size)
+            case _:
+                length = rng.randint(1, size - 1)
+                x2 = x1 + length if x1 + length < size else x1 - length
+                y2 = y1 + length if y1 + length < size else y1 - length
+                if not (0 <= x2 < size and 0 <= y2 < size):
+                    x2, y2 = x1, y1
+        yield f"{x1},{y1} -> {x2},{y2}"
+
+
+@generator("2021", "06")
+def lanternfish(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    count = len(real_lines[0].split(",")) * scale
+    yield ",".join(str(rng.randint(1, 5)) for _ in range(count))
+
+
+@generator("2021", "07")
+def the_treachery_of_whales(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    positions = list(map(int, real_lines[0].split(",")))
+    yield ",".join(str(int(rng.expovariate(1 / 400)) % max(positions)) for _ in range(len(positions) * scale))
+
+
+DIGIT_SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+@generator("2021", "08")
+def seven_segment_search(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(len(real_lines) * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def scramble(segments: str) -> str:
+            return "".join(rng.sample([wiring[segment] for segment in segments], len(segments)))
+
+        patterns = [scramble(segments) for segments in rng.sample(DIGIT_SEGMENTS, 10)]
+        output = [scramble(rng.choice(DIGIT_SEGMENTS)) for _ in range(4)]
+        yield f"{' '.join(patterns)} | {' '.join(output)}"
+
+
+@generator("2021", "09")
+def smoke_basin(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    yield from digit_grid(real_lines, scale, rng)
+
+
+CHUNK_DELIMITERS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@generator("2021", "10")
+def syntax_scoring(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    length = max(map(len, real_lines))
+    for _ in range(len(real_lines) * scale):
+        corrupted = rng.random() < 0.5
+        line, stack = [], []
+        while len(line) < length:
+            if stack and rng.random() < 0.45:
+                line.append(CHUNK_DELIMITERS[stack.pop()])
+            else:
+                stack.append(rng.choice(list(CHUNK_DELIMITERS)))
+                line.append(stack[-1])
+        if corrupted and stack:
+            expected = CHUNK_DELIMITERS[stack[-1]]
+            line.append(rng.choice([closing for closing in CHUNK_DELIMITERS.values() if closing != expected]))
+        elif not stack:
+            line.append("(")
+        yield "".join(line)
+
+
+@generator("2021", "11")
+def dumbo_octopus(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    yield from digit_grid(real_lines, scale, rng, square=True)
+
+
+@generator("2021", "12")
+def passage_pathing(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    # Big caves only ever connect to small caves, otherwise paths would be infinite.
+    caves = {cave for line in real_lines for cave in line.split("-")} - {"start", "end"}
+    small_count = sum(cave.islower() for cave in caves) * scale
+    big_count = sum(cave.isupper() for cave in caves) * scale
+    small = [f"c{index}" for index in range(small_count)]
+    big = [f"C{index}" for index in range(big_count)]
+    edges = {}
+    for cave in ("start", "end"):
+        for other in rng.sample(small + big, min(3, len(small + big))):
+            edges[(cave, other)] = None
+    while len(edges) < len(real_lines) * scale:
+        cave = rng.choice(small)
+        other = rng.choice(small + big)
+        if cave != other and (other, cave) not in edges:
+            edges[(cave, other)] = None
+    for cave, other in edges:
+        yield f"{cave}-{other}"
+
+
+@generator("2021", "13")
+def transparent_origami(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    points = [tuple(map(int, line.split(","))) for line in real_lines if "," in line]
+    target_area = (max(x for x, _ in points) + 1) * (max(y for _, y in points) + 1) * scale
+    width, height, x_folds, y_folds = 40, 6, [], []
+    while width * height < target_area:
+        if width <= height * 4:
+            x_folds.insert(0, width)
+            width = width * 2 + 1
+        else:
+            y_folds.insert(0, height)
+            height = height * 2 + 1
+
+    def lands_on_fold(value: int, folds: List[int]) -> bool:
+        for along in folds:
+            if value == along:
+                return True
+            if value > along:
+                value = 2 * along - value
+        return False
+
+    count = 0
+    yield f"{width - 1},{height - 1}"
+    while count < len(points) * scale:
+        x, y = rng.randrange(width), rng.randrange(height)
+        if not lands_on_fold(x, x_folds) and not lands_on_fold(y, y_folds):
+            count += 1
+            yield f"{x},{y}"
+    yield ""
+    for index in range(max(len(x_folds), len(y_folds))):
+        if index < len(x_folds):
+            yield f"fold along x={x_folds[index]}"
+        if index < len(y_folds):
+            yield f"fold along y={y_folds[index]}"
+
+
+@generator("2021", "14")
+def extended_polymerization(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    elements = sorted({char for line in real_lines for char in line if char.isupper()})
+    yield "".join(rng.choices(elements, k=len(real_lines[0]) * scale))
+    yield ""
+    for first in elements:
+        for second in elements:
+            yield f"{first}{second} -> {rng.choice(elements)}"
+
+
+@generator("2021", "15")
+def chiton(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    yield from digit_grid(real_lines, scale, rng, digits="123456789")
+
+
+@generator("2021", "16")
+def packet_decoder(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    target_bits = len(real_lines[0]) * 4 * scale
+    packets, size = [], 0
+    while size < target_bits:
+        packets.append(random_packet(rng, depth=3))
+        size += len(packets[-1])
+    while len(packets) > 1:
+        packets = [operator_packet(rng, 0, packets[i:i + 2047]) for i in range(0, len(packets), 2047)]
+    bits = packets[0] + "0" * (-len(packets[0]) % 8)
+    yield f"{int(bits, 2):0{len(bits) // 4}X}"
+
+
+def random_packet(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.4:
+        value = f"{rng.randrange(1, 1 << 12):b}"
+        value = "0" * (-len(value) % 4) + value
+        groups = [value[i:i + 4] for i in range(0, len(value), 4)]
+        body = "".join(("1" if i < len(groups) - 1 else "0") + group for i, group in enumerate(groups))
+        return f"{rng.randrange(8):03b}100{body}"
+    ptype = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    count = 2 if ptype >= 5 else rng.randint(1, 3)
+    return operator_packet(rng, ptype, [random_packet(rng, depth - 1) for _ in range(count)])
+
+
+def operator_packet(rng: random.Random, ptype: int, subpackets: List[str]) -> str:
+    content = "".join(subpackets)
+    header = f"{rng.randrange(8):03b}{ptype:03b}"
+    if len(content) < 1 << 15 and rng.random() < 0.5:
+        return f"{header}0{len(content):015b}{content}"
+    return f"{header}1{len(subpackets):011b}{content}"
+
+
+# --- 2022 ---------------------------------------------------------------------
+
+
+@generator("2022", "01")
+def calorie_counting(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    elves = sum(1 for line in real_lines if not line.strip()) + 1
+    for _ in range(elves * scale):
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
+        yield ""
+
+
+@generator("2022", "02")
+def rock_paper_scissors(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(len(real_lines) * scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+@generator("2022", "03")
+def rucksack_reorganization(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    # Each rucksack shares one item between its halves; each group of three shares one badge.
+    for _ in range(len(real_lines) * scale // 3):
+        badge, *others = rng.sample(string.ascii_letters, len(string.ascii_letters))
+        excluded = {item: rng.randrange(3) for item in others}
+        for elf in range(3):
+            allowed = [item for item in others if excluded[item] != elf]
+            rng.shuffle(allowed)
+            size = rng.randint(4, min(16, (len(allowed) + 2) // 2))
+            shared, fillers = allowed[0], allowed[1:]
+            left = [badge, shared, *fillers[:size - 2]]
+            right = [shared, *fillers[size - 2:2 * size - 3]]
+            yield "".join(rng.sample(left, size)) + "".join(rng.sample(right, size))
+
+
+@generator("2022", "04")
+def camp_cleanup(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    def section() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    for _ in range(len(real_lines) * scale):
+        yield f"{section()},{section()}"
+
+
+@generator("2022", "05")
+def supply_stacks(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    drawing_end = real_lines.index("")
+    crates = sum(line.count("[") for line in real_lines[:drawing_end]) * scale
+    stack_count = len(real_lines[drawing_end - 1].split())
+    stacks = [[] for _ in range(stack_count)]
+    for _ in range(crates):
+        rng.choice(stacks).append(rng.choice(string.ascii_uppercase))
+    for level in reversed(range(max(map(len, stacks)))):
+        yield " ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks)
+    yield " ".join(f" {number} " for number in range(1, stack_count + 1))
+    yield ""
+    heights = list(map(len, stacks))
+    for _ in range((len(real_lines) - drawing_end - 1) * scale):
+        source = rng.choice([index for index, height in enumerate(heights) if height])
+        target = rng.choice([index for index in range(stack_count) if index != source])
+        moved = rng.randint(1, min(heights[source], 30))
+        heights[source] -= moved
+        heights[target] += moved
+        yield f"move {moved} from {source + 1} to {target + 1}"
+
+
+@generator("2022", "06")
+def tuning_trouble(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    # Only three distinct characters before the markers, so the whole buffer has to be scanned.
+    length = len(real_lines[0]) * scale
+    marker = rng.sample(string.ascii_lowercase, 14)
+    prefix = rng.choices(marker[:3], k=max(0, length - 2 * len(marker)))
+    tail = rng.choices(string.ascii_lowercase, k=len(marker))
+    yield "".join(prefix + marker + tail)
+
+
+@generator("2022", "07")
+def no_space_left_on_device(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    budget = [len(real_lines) * scale]
+
+    def explore(depth: int) -> Iterator[str]:
+        files = rng.sample(range(1 << 20), rng.randint(1, 6))
+        folders = rng.sample(range(1 << 20), rng.randint(1, 5) if depth < 12 and budget[0] > 0 else 0)
+        budget[0] -= 1 + len(files) + 3 * len(folders)
+        yield "$ ls"
+        yield from (f"dir d{folder}" for folder in folders)
+        yield from (f"{rng.randint(1000, 300000)} f{file}.{rng.choice(['txt', 'dat', 'log'])}" for file in files)
+        for folder in folders:
+            yield f"$ cd d{folder}"
+            yield from explore(depth + 1)
+            yield "$ cd .."
+
+    yield "$ cd /"
+    yield from explore(0)
+
+
+@generator("2022", "08")
+def treetop_tree_house(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    yield from digit_grid(real_lines, scale, rng)
+
+
+@generator("2022", "09")
+def rope_bridge(real_lines: List[str], scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(len(real_lines) * scale):
+        yield f"{rng.choice('RLUD')} {rng.randint(1, 19)}"
@@ -0,0 +1,155 @@
+"""
+Rectangular grids with precomputed neighbor tables.
+
+Cells are addressed by their flat (row-major) index. The 4- and 8-neighbors of
+every cell are computed once per grid shape and stored in compressed sparse row
+form: the neighbors of cell `i` are `indices[offsets[i]:offsets[i + 1]]`. For
+whole-grid updates, `shifted` views line every cell up with one of its
+neighbors, so that neighborhoods are combined with array arithmetic instead.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .cache import cache
+
+
+Shape = Tuple[int, int]
+Position = Tuple[int, int]
+
+ORTHOGONAL: Sequence[Position] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+"""
+Offsets of the 4-neighbors of a cell: left, right, up, down.
+"""
+DIAGONAL: Sequence[Position] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL_DIRECTIONS: Sequence[Position] = (*ORTHOGONAL, *DIAGONAL)
+
+
+@dataclass(frozen=True)
+class Neighbors:
+    offsets: np.ndarray
+    """
+    Start of the neighbors of each cell in `indices`, plus the end of the last one.
+    """
+    indices: np.ndarray
+    """
+    Flat indices of the neighbors of every cell, one cell after the other.
+    """
+
+    def of(self, index: int) -> np.ndarray:
+        return self.indices[self.offsets[index]:self.offsets[index + 1]]
+
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def sources(self) -> np.ndarray:
+        """
+        Flat index of the cell each entry of `indices` is a neighbor of.
+        """
+        return np.repeat(np.arange(len(self.offsets) - 1), self.counts())
+
+    @cached_property
+    def lists(self) -> List[List[int]]:
+        """
+        Neighbors of every cell as Python lists, which are faster to walk from Python loops than arrays.
+        """
+        flat = self.indices.tolist()
+        bounds = self.offsets.tolist()
+        return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@cache(maxsize=16)
+def neighbor_table(shape: Shape, diagonal: bool = False) -> Neighbors:
+    """
+    Returns the 4-neighbors (or 8-neighbors, if `diagonal`) of every cell of a grid of `shape`.
+    """
+    rows, cols = shape
+    row, col = np.divmod(np.arange(rows * cols), cols)
+    directions = ALL_DIRECTIONS if diagonal else ORTHOGONAL
+    targets = np.stack([(row + drow) * cols + col + dcol for drow, dcol in directions], axis=1)
+    valid = np.stack([
+        (0 <= row + drow) & (row + drow < rows) & (0 <= col + dcol) & (col + dcol < cols)
+        for drow, dcol in directions
+    ], axis=1)
+    offsets = np.zeros(rows * cols + 1, dtype=np.int32)
+    np.cumsum(valid.sum(axis=1), out=offsets[1:])
+    return Neighbors(offsets=offsets, indices=targets[valid].astype(np.int32))
+
+
+def shifted(values: np.ndarray, drow: int, dcol: int, fill=0) -> np.ndarray:
+    """
+    Returns an array of the same shape where each cell holds the value of its neighbor at `(drow, dcol)`,
+    or `fill` where that neighbor is outside the grid.
+    """
+    rows, cols = values.shape
+    result = np.full_like(values, fill)
+    result[max(0, -drow):rows - max(0, drow), max(0, -dcol):cols - max(0, dcol)] = \
+        values[max(0, drow):rows - max(0, -drow), max(0, dcol):cols - max(0, -dcol)]
+    return result
+
+
+def neighbor_views(values: np.ndarray, diagonal: bool = False, fill=0) -> List[np.ndarray]:
+    """
+    Returns one shifted view of `values` per neighbor direction.
+    """
+    return [shifted(values, drow, dcol, fill) for drow, dcol in (ALL_DIRECTIONS if diagonal else ORTHOGONAL)]
+
+
+def neighbor_sum(values: np.ndarray, diagonal: bool = False) -> np.ndarray:
+    """
+    Sums the neighbors of every cell, counting cells outside the grid as 0.
+    Summing a boolean mask counts the neighbors that are set.
+    """
+    total = np.zeros(values.shape, dtype=np.int64 if values.dtype == bool else values.dtype)
+    for view in neighbor_views(values.astype(total.dtype, copy=False), diagonal):
+        total += view
+    return total
+
+
+@dataclass(frozen=True, eq=False)
+class Grid:
+    values: np.ndarray
+    """
+    2D array of cell values.
+    """
+
+    @property
+    def shape(self) -> Shape:
+        return self.values.shape
+
+    @property
+    def size(self) -> int:
+        return self.values.size
+
+    @property
+    def flat(self) -> np.ndarray:
+        """
+        Row-major view of the values, indexed by flat cell index.
+        """
+        return self.values.reshape(-1)
+
+    @cached_property
+    def neighbors(self) -> Neighbors:
+        return neighbor_table(self.shape)
+
+    @cached_property
+    def all_neighbors(self) -> Neighbors:
+        """
+        8-neighbors of every cell, diagonals included.
+        """
+        return neighbor_table(self.shape, diagonal=True)
+
+    def index(self, position: Position) -> int:
+        return position[0] * self.shape[1] + position[1]
+
+    def position(self, index: int) -> Position:
+        return divmod(index, self.shape[1])
+
+    def positions(self) -> List[Position]:
+        """
+        Returns the `(row, col)` position of every cell, in flat index order.
+        """
+        cols = self.shape[1]
+        return [divmod(index, cols) for index in range(self.size)]
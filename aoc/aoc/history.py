@@ -0,0 +1,251 @@
+"""
+Benchmark history, stored in SQLite, and regression detection between runs.
+
+Every benchmark run keeps its raw samples, keyed by git commit, Python
+version and machine, so that any two runs can be compared with a
+Mann-Whitney U test per day and phase.
+"""
+import datetime
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .bench import BenchResult
+
+
+HISTORY_PATH = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "bench_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    git_commit TEXT,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    input_file TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    year TEXT NOT NULL,
+    day TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    elapsed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_run ON samples(run_id);
+"""
+
+
+@dataclass
+class Run:
+    id: int
+    timestamp: str
+    git_commit: Optional[str]
+    dirty: bool
+    python: str
+    machine: str
+    input_file: str
+
+    def describe(self) -> str:
+        commit = (self.git_commit or "unknown")[:10] + ("+dirty" if self.dirty else "")
+        return f"#{self.id} {self.timestamp} {commit} python {self.python} on {self.machine} ({self.input_file})"
+
+
+@dataclass
+class Comparison:
+    day: str
+    phase: str
+    baseline: float
+    """
+    Median of the baseline samples, in seconds.
+    """
+    candidate: float
+    """
+    Median of the candidate samples, in seconds.
+    """
+    p_value: float
+    """
+    One-sided p-value of the candidate being slower than the baseline.
+    """
+    slower: bool
+
+    @property
+    def change(self) -> float:
+        return self.candidate / self.baseline - 1 if self.baseline else 0.0
+
+
+@contextmanager
+def connect(path: Path = HISTORY_PATH) -> Iterator[sqlite3.Connection]:
+    """
+    Opens the history database for one transaction, committed if the block succeeds; the connection is closed either way.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(path)) as connection:
+        connection.executescript(SCHEMA)
+        with connection:
+            yield connection
+
+
+def record(results: Sequence[BenchResult], input_file: str = "input.txt", path: Path = HISTORY_PATH) -> Run:
+    """
+    Stores the samples of `results` as a new run, returning it.
+    """
+    commit, dirty = git_state()
+    run = Run(
+        id=0,
+        timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+        git_commit=commit,
+        dirty=dirty,
+        python=f"{platform.python_implementation()} {platform.python_version()}",
+        machine=f"{platform.node()} {platform.machine()}",
+        input_file=input_file,
+    )
+    with connect(path) as connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (timestamp, git_commit, dirty, python, machine, input_file) VALUES (?, ?, ?, ?, ?, ?)",
+            (run.timestamp, run.git_commit, run.dirty, run.python, run.machine, run.input_file),
+        )
+        run.id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO samples (run_id, year, day, phase, elapsed) VALUES (?, ?, ?, ?, ?)",
+            [
+                (run.id, result.day.year, result.day.day, phase, elapsed)
+                for result in results
+                for phase, samples in result.samples.items()
+                for elapsed in samples
+            ],
+        )
+    return run
+
+
+def git_state() -> Tuple[Optional[str], bool]:
+    """
+    Returns the current commit and whether the working tree has uncommitted changes.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, bool(status.stdout.strip())
+
+
+def list_runs(path: Path = HISTORY_PATH, limit: Optional[int] = None) -> List[Run]:
+    """
+    Returns the recorded runs, most recent first.
+    """
+    with connect(path) as connection:
+        rows = connection.execute(
+            "SELECT id, timestamp, git_commit, dirty, python, machine, input_file FROM runs ORDER BY id DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+    return [Run(*row[:3], bool(row[3]), *row[4:]) for row in rows]
+
+
+def find_run(selector: str, path: Path = HISTORY_PATH) -> Optional[Run]:
+    """
+    Finds the most recent run matching `selector`: a run id (like `#12` or `12`) or a git commit prefix.
+    """
+    for run in list_runs(path):
+        if selector.lstrip("#") == str(run.id) or (run.git_commit or "").startswith(selector):
+            return run
+    return None
+
+
+def previous_comparable(run: Run, path: Path = HISTORY_PATH) -> Optional[Run]:
+    """
+    Finds the latest run before `run` on the same machine, Python and input, to use as its baseline.
+    """
+    for other in list_runs(path):
+        if other.id < run.id and (other.python, other.machine, other.input_file) == (run.python, run.machine, run.input_file):
+            return other
+    return None
+
+
+def load_samples(run: Run, path: Path = HISTORY_PATH) -> Dict[Tuple[str, str], List[float]]:
+    """
+    Returns the samples of `run` by (day name, phase).
+    """
+    samples: Dict[Tuple[str, str], List[float]] = {}
+    with connect(path) as connection:
+        for year, day, phase, elapsed in connection.execute(
+            "SELECT year, day, phase, elapsed FROM samples WHERE run_id = ?", (run.id,)
+        ):
+            samples.setdefault((f"{year}/{day}", phase), []).append(elapsed)
+    return samples
+
+
+def compare(baseline: Run, candidate: Run, alpha: float = 0.05, threshold: float = 0.1, min_delta: float = 0.001,
+            path: Path = HISTORY_PATH) -> List[Comparison]:
+    """
+    Compares every day and phase measured in both runs.
+    A slowdown is flagged when it is statistically significant at `alpha` and the median grew
+    by more than `threshold` (relative) and `min_delta` (in seconds), which filters out noise on very short phases.
+    """
+    before, after = load_samples(baseline, path), load_samples(candidate, path)
+    comparisons = []
+    for key in sorted(before.keys() & after.keys()):
+        baseline_median, candidate_median = statistics.median(before[key]), statistics.median(after[key])
+        p_value = mann_whitney_greater(after[key], before[key])
+        comparisons.append(Comparison(
+            day=key[0],
+            phase=key[1],
+            baseline=baseline_median,
+            candidate=candidate_median,
+            p_value=p_value,
+            slower=(
+                p_value < alpha
+                and candidate_median > baseline_median * (1 + threshold)
+                and candidate_median - baseline_median > min_delta
+            ),
+        ))
+    return comparisons
+
+
+def mann_whitney_greater(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test p-value for `xs` tending to be larger than `ys`.
+    Exact for small samples (assuming no ties), normal approximation otherwise.
+    """
+    m, n = len(xs), len(ys)
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in xs for y in ys)
+    if m <= 20 and n <= 20:
+        at_least = sum(arrangements(m, n, k) for k in range(math.ceil(u), m * n + 1))
+        return at_least / math.comb(m + n, m)
+    mean, sd = m * n / 2, math.sqrt(m * n * (m + n + 1) / 12)
+    z = (u - 0.5 - mean) / sd
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@lru_cache(maxsize=None)
+def arrangements(m: int, n: int, u: int) -> int:
+    """
+    Number of orderings of `m` and `n` samples with U statistic `u`.
+    """
+    if u < 0:
+        return 0
+    if m == 0 or n == 0:
+        return int(u == 0)
+    return arrangements(m - 1, n, u - n) + arrangements(m, n - 1, u)
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    """
+    Formats one line per day and phase (times in milliseconds), marking slowdowns.
+    """
+    lines = [f"{'day':<8} {'phase':<10} {'baseline':>10} {'candidate':>10} {'change':>8} {'p':>7}"]
+    for comparison in comparisons:
+        flag = "  SLOWER" if comparison.slower else ""
+        lines.append(
+            f"{comparison.day:<8} {comparison.phase:<10} {comparison.baseline * 1000:10.2f} {comparison.candidate * 1000:10.2f} "
+            f"{comparison.change:+8.1%} {comparison.p_value:7.3f}{flag}"
+        )
+    return "\n".join(lines)
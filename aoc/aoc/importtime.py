@@ -0,0 +1,126 @@
+"""
+Import-time budget checks, based on `python -X importtime`.
+
+Every target is imported in a fresh interpreter, so the measurements include
+everything it pulls in, as a short-lived solver invocation would pay for it.
+"""
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .days import Day
+
+
+CLI_MODULE = "aoc.cli.app"
+
+PROJECT_ROOT = Path(__file__).parent.parent
+"""
+Imports of the CLI run from here, so that the repository's `aoc` folder does not shadow the package.
+"""
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_time: float
+    """
+    Time spent importing the module itself, in seconds.
+    """
+    cumulative: float
+    """
+    Time spent importing the module and everything it imported, in seconds.
+    """
+    depth: int
+
+
+@dataclass
+class ImportTime:
+    target: str
+    total: float = 0.0
+    """
+    Cumulative import time of the target, in seconds.
+    """
+    heaviest: List[ImportRecord] = field(default_factory=list)
+    """
+    Direct imports of the target, slowest first.
+    """
+    error: Optional[str] = None
+
+    def within(self, budget: float) -> bool:
+        return self.error is None and self.total <= budget
+
+
+def measure(module: str, cwd: Optional[Path] = None, path: Sequence[Path] = ()) -> ImportTime:
+    """
+    Imports `module` in a fresh interpreter with `-X importtime`, with `path` prepended to `sys.path`.
+    """
+    statement = f"import sys; sys.path[:0] = {[str(entry) for entry in path]!r}; import {module}"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], cwd=cwd, capture_output=True, text=True
+    )
+    result = ImportTime(target=module)
+    if process.returncode != 0:
+        result.error = process.stderr.strip().splitlines()[-1]
+        return result
+    children: List[ImportRecord] = []
+    for record in parse_records(process.stderr):
+        if record.depth == 0 and record.module == module:
+            result.total = record.cumulative
+            result.heaviest = sorted(children, key=lambda child: child.cumulative, reverse=True)
+        elif record.depth == 0:
+            children = []
+        elif record.depth == 1:
+            children.append(record)
+    return result
+
+
+def measure_cli() -> ImportTime:
+    return measure(CLI_MODULE, cwd=PROJECT_ROOT)
+
+
+def measure_day(day: Day) -> ImportTime:
+    """
+    Measures the import time of a day solver module, imported from its folder.
+    """
+    result = measure(day.path.stem, cwd=day.workdir, path=[day.folder])
+    result.target = day.name
+    return result
+
+
+def parse_records(stderr: str) -> List[ImportRecord]:
+    """
+    Parses the `-X importtime` log; records are listed after the modules they imported.
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_time, cumulative, indent, module = match.groups()
+            records.append(ImportRecord(
+                module=module,
+                self_time=int(self_time) / 1e6,
+                cumulative=int(cumulative) / 1e6,
+                depth=len(indent) // 2,
+            ))
+    return records
+
+
+def format_import_times(results: Sequence[ImportTime], budget: float, limit: int = 3) -> str:
+    """
+    Formats one line per target, flagging those over `budget` (in seconds).
+    """
+    width = max([len("target"), *(len(result.target) for result in results)])
+    lines = [f"{'target':<{width}}  {'ms':>8}  heaviest imports (ms)"]
+    for result in results:
+        if result.error is not None:
+            lines.append(f"{result.target:<{width}}  {'ERROR':>8}  {result.error}")
+            continue
+        heaviest = ", ".join(f"{record.module} {record.cumulative * 1000:.1f}" for record in result.heaviest[:limit])
+        flag = "" if result.within(budget) else "  OVER BUDGET"
+        lines.append(f"{result.target:<{width}}  {result.total * 1000:8.1f}  {heaviest}{flag}")
+    return "\n".join(lines)
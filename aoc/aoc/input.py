@@ -0,0 +1,147 @@
+"""
+Zero-copy loading of puzzle inputs through memory-mapped files.
+
+Inputs are mapped read-only instead of being read into a list of strings,
+so only the lines (or grid cells) a solver actually holds on to are copied.
+Digit grids are converted once to uint8 `.npy` files, which later runs map
+directly instead of parsing the text again.
+
+Every reader also accepts an open file (text or binary, like `sys.stdin`) in
+place of a path; streams are read a line at a time as the solver consumes them,
+so an input piped in is never held in memory as a whole.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterator, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+Buffer = Union[mmap.mmap, bytes]
+
+Source = Union[Path, str, IO]
+"""
+A path to an input file, or an open file to read it from.
+"""
+
+GRID_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "grids"
+
+
+def map_input(path: Path) -> Buffer:
+    """
+    Maps `path` read-only in memory; empty files (which cannot be mapped) are returned as `b""`.
+    """
+    with open(path, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+def is_stream(source: Source) -> bool:
+    return hasattr(source, "read")
+
+
+def read_lines(source: Source, strip: bool = False) -> Iterator[str]:
+    """
+    Returns an iterator over the lines of `source`, decoding them one at a time.
+    Lines keep their trailing newline unless `strip` is set, which strips all surrounding whitespace.
+    A file is mapped right away, so a missing file fails here rather than on the first line.
+    """
+    if is_stream(source):
+        return _iter_stream(source, strip)
+    return _iter_lines(map_input(source), strip)
+
+
+def _iter_stream(stream: IO, strip: bool) -> Iterator[str]:
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode()
+        yield line.strip() if strip else line
+
+
+def _iter_lines(buffer: Buffer, strip: bool) -> Iterator[str]:
+    start, end = 0, len(buffer)
+    try:
+        while start < end:
+            stop = buffer.find(b"\n", start)
+            stop = end if stop < 0 else stop + 1
+            line = buffer[start:stop].decode()
+            yield line.strip() if strip else line
+            start = stop
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def read_view(path: Path) -> memoryview:
+    """
+    Returns a read-only view over the raw bytes of `path`.
+    The mapping is released once the view (and every slice of it) is garbage collected.
+    """
+    return memoryview(map_input(path))
+
+
+def read_bytes(source: Source) -> Buffer:
+    """
+    Returns the raw bytes of `source`: a file is mapped, a stream is read to its end.
+    """
+    if not is_stream(source):
+        return map_input(source)
+    data = source.read()
+    return data.encode() if isinstance(data, str) else data
+
+
+def read_byte_grid(source: Source) -> "np.ndarray":
+    """
+    Returns a read-only `(rows, columns)` uint8 view over the characters of a rectangular grid,
+    skipping the newlines without copying.
+    """
+    import numpy as np
+
+    buffer = read_bytes(source)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    width = buffer.find(b"\n")
+    if width < 0:
+        return data.reshape(1, -1)
+    rows = (len(data) + 1) // (width + 1)
+    return np.lib.stride_tricks.as_strided(data, shape=(rows, width), strides=(width + 1, 1), writeable=False)
+
+
+def read_digit_grid(source: Source) -> "np.ndarray":
+    """
+    Returns the digits of a rectangular grid (like `2199943210`) as a `(rows, columns)` uint8 array.
+    """
+    return read_byte_grid(source) - ord("0")
+
+
+def load_digit_grid(path: Source, cache_dir: Path = GRID_DIR) -> "np.ndarray":
+    """
+    Returns the digits of a rectangular grid file as a read-only uint8 array, memory-mapped from its `.npy` conversion.
+    The file is converted on first use; the conversion is keyed by the path, size and modification time of the input,
+    so that it is found again without reading the input at all, and by the source of the conversion, so that it is
+    redone when the parsing code changes. Streams have nothing to key on and are parsed directly.
+    """
+    import numpy as np
+
+    from .parse_cache import source_digest
+
+    if is_stream(path):
+        return read_digit_grid(path)
+    stat = os.stat(path)
+    key = f"{Path(path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{source_digest(read_digit_grid).hex()}"
+    entry = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.npy"
+    try:
+        return np.load(entry, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+    grid = read_digit_grid(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".npy", delete=False) as tmp:
+        np.save(tmp, grid)
+    os.replace(tmp.name, entry)
+    return np.load(entry, mmap_mode="r")
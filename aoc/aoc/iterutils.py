@@ -0,0 +1,81 @@
+"""
+Iteration helpers shared by the day solvers.
+
+They stay lazy and build nothing but the tuples they yield: windows come from
+`tee`d iterators advanced with `islice` and zipped together, so sliding over
+an input costs no copying or reslicing per step. Arrays get the NumPy
+equivalent, `sliding_windows`, which is a view and copies nothing at all.
+"""
+from collections import deque
+from itertools import islice, tee
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+T = TypeVar("T")
+
+
+def windowed(iterable: Iterable[T], size: int = 2) -> Iterator[Tuple[T, ...]]:
+    """
+    Returns an iterator over the overlapping windows of `size` consecutive elements of `iterable`.
+    """
+    iterators = tee(iterable, size)
+    for skip, iterator in enumerate(iterators):
+        consume(iterator, skip)
+    return zip(*iterators)
+
+
+def pairwise(iterable: Iterable[T]) -> Iterator[Tuple[T, T]]:
+    """
+    Returns an iterator over consecutive pairs in `iterable`.
+    """
+    return windowed(iterable, 2)
+
+
+def window_pairs(iterable: Iterable[T], size: int = 2) -> Iterator[Tuple[Tuple[T, ...], Tuple[T, ...]]]:
+    """
+    Returns an iterator over pairs of consecutive windows of `size` elements in `iterable`.
+    """
+    return pairwise(windowed(iterable, size))
+
+
+def grouped(iterable: Iterable[T], size: int = 2) -> Iterator[Tuple[T, ...]]:
+    """
+    Returns an iterator over the non-overlapping groups of `size` elements of `iterable`; the last one may be shorter.
+    """
+    if isinstance(iterable, Sequence):
+        # Zipping one iterator with itself packs full groups without any Python-level step;
+        # the shorter last group is sliced off the sequence.
+        yield from zip(*[iter(iterable)] * size)
+        if remainder := len(iterable) % size:
+            yield tuple(iterable[-remainder:])
+    else:
+        iterator = iter(iterable)
+        yield from iter(lambda: tuple(islice(iterator, size)), ())
+
+
+def first(iterable: Iterable[T], condition: Callable[[T], bool]) -> T:
+    """
+    Returns the first element of `iterable` satisfying `condition`.
+    """
+    return next(element for element in iterable if condition(element))
+
+
+def consume(iterator: Iterator[T], count: int) -> None:
+    """
+    Advances `iterator` by `count` elements without keeping them.
+    """
+    deque(islice(iterator, count), maxlen=0)
+
+
+def sliding_windows(array: "np.ndarray", size: int) -> "np.ndarray":
+    """
+    Returns a read-only view of the windows of `size` consecutive elements of `array` along its first axis.
+    The window runs along a new last axis: a 1-D array of length `n` gives one window per row, `(n - size + 1, size)`,
+    while an `(n, columns)` array gives `(n - size + 1, columns, size)`, each column windowed separately.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    return sliding_window_view(array, size, axis=0)
@@ -0,0 +1,116 @@
+"""
+Time and memory budgets for solving a day.
+
+Each day runs in its own worker process, which can be killed without taking
+the rest of a batch down with it. The budgets are enforced twice: the worker
+sets resource limits on itself (CPU time and data segment size, which the
+kernel enforces even if the parent is stuck), and the parent watches its wall
+time and resident memory, killing it as soon as either goes over budget.
+"""
+import math
+import multiprocessing
+import os
+import resource
+import signal
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Optional
+
+from .days import Day, Solution, solve
+
+
+POLL_INTERVAL = 0.05
+"""
+How often the parent checks on a worker, in seconds.
+"""
+
+TIME = "time"
+MEMORY = "memory"
+
+
+@dataclass(frozen=True)
+class Limits:
+    time: Optional[float] = None
+    """
+    Wall time budget of a day, in seconds.
+    """
+    memory: Optional[int] = None
+    """
+    Resident memory budget of a day, in bytes.
+    """
+
+
+def solve_limited(day: Day, filename: str = "input.txt", limits: Limits = Limits(), **options: Any) -> Solution:
+    """
+    Solves `day` in a worker process within `limits`, accepting the same options as `solve`.
+    A day going over budget is reported in the solution, with `limit` set to the budget it exceeded.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    context = multiprocessing.get_context("forkserver")
+    worker = context.Process(target=_solve_worker, args=(sender, day, filename, limits, options), daemon=True)
+    start = time.monotonic()
+    worker.start()
+    sender.close()
+    try:
+        while not receiver.poll(POLL_INTERVAL):
+            elapsed = time.monotonic() - start
+            if not worker.is_alive():
+                break
+            if limits.time is not None and elapsed > limits.time:
+                return exceeded(day, TIME, f"Timed out after {elapsed:.1f} s")
+            if limits.memory is not None and resident_memory(worker.pid) > limits.memory:
+                return exceeded(day, MEMORY, f"Used more than {limits.memory >> 20} MiB")
+        try:
+            solution = receiver.recv()
+        except EOFError:
+            return killed(day, worker, limits)
+    finally:
+        if worker.is_alive():
+            worker.kill()
+        worker.join()
+        receiver.close()
+    if solution.error is not None and solution.error.startswith(f"{MemoryError.__name__}:"):
+        solution.limit = MEMORY
+    return solution
+
+
+def _solve_worker(sender: Connection, day: Day, filename: str, limits: Limits, options: dict) -> None:
+    if limits.time is not None:
+        # A backstop for a stuck parent: the kernel stops the worker a little after its budget.
+        seconds = math.ceil(limits.time) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    if limits.memory is not None:
+        resource.setrlimit(resource.RLIMIT_DATA, (limits.memory, limits.memory))
+    solution = solve(day, filename, **options)
+    sender.send(solution)
+    sender.close()
+
+
+def killed(day: Day, worker: multiprocessing.Process, limits: Limits) -> Solution:
+    """
+    Reports a worker that died without replying, from the signal that killed it.
+    """
+    worker.join()
+    if worker.exitcode == -signal.SIGXCPU and limits.time is not None:
+        return exceeded(day, TIME, f"Used more than {limits.time:.1f} s of CPU time")
+    if worker.exitcode != 0 and limits.memory is not None:
+        # Native code (or the kernel's OOM killer) ends the process outright when allocations fail.
+        return exceeded(day, MEMORY, f"Worker died with code {worker.exitcode} within {limits.memory >> 20} MiB")
+    return Solution(day=day, error=f"Worker exited with code {worker.exitcode}")
+
+
+def exceeded(day: Day, limit: str, message: str) -> Solution:
+    return Solution(day=day, error=message, limit=limit)
+
+
+def resident_memory(pid: int) -> int:
+    """
+    Returns the resident memory of process `pid` in bytes, or 0 where `/proc` is not available.
+    """
+    try:
+        resident_pages = int(Path(f"/proc/{pid}/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
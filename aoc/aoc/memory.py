@@ -0,0 +1,68 @@
+"""
+Memory instrumentation of solver phases, based on tracemalloc.
+"""
+import contextlib
+import tracemalloc
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class MemoryUsage:
+    peak: int = 0
+    """
+    Highest traced memory reached during the phase, above what was allocated before it (bytes).
+    """
+    retained: int = 0
+    """
+    Traced memory still allocated when the phase ends, above what was allocated before it (bytes).
+    """
+    blocks: int = 0
+    """
+    Net number of memory blocks allocated by the phase.
+    """
+
+
+@contextlib.contextmanager
+def tracing() -> Iterator[None]:
+    """
+    Traces memory allocations for the duration of the block.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def track() -> Iterator[MemoryUsage]:
+    """
+    Measures the memory used by the block; memory must be traced already.
+    """
+    usage = MemoryUsage()
+    blocks_before = count_blocks()
+    current_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    try:
+        yield usage
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        usage.peak = peak - current_before
+        usage.retained = current - current_before
+        usage.blocks = count_blocks() - blocks_before
+
+
+def count_blocks() -> int:
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
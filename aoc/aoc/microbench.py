@@ -0,0 +1,142 @@
+"""
+Micro-benchmarks of the shared helpers against the per-day code they replaced.
+
+Each benchmark builds its input once and times every implementation on it,
+reporting the best time per input element, so that a helper sitting in a hot
+loop can be checked for overhead in isolation.
+"""
+import timeit
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from . import iterutils
+
+
+@dataclass(frozen=True)
+class MicroBenchmark:
+    name: str
+    setup: Callable[[int], Any]
+    """
+    Builds the input of `n` elements passed to every implementation.
+    """
+    implementations: Dict[str, Callable[[Any], Any]]
+
+
+@dataclass
+class MicroResult:
+    benchmark: MicroBenchmark
+    size: int
+    times: Dict[str, float]
+    """
+    Best time of each implementation per input element, in seconds.
+    """
+
+
+BENCHMARKS: List[MicroBenchmark] = []
+
+
+def exhaust(iterator: Iterable[Any]) -> None:
+    deque(iterator, maxlen=0)
+
+
+def measure(benchmark: MicroBenchmark, size: int = 100_000, repeat: int = 5) -> MicroResult:
+    data = benchmark.setup(size)
+    times = {}
+    for name, implementation in benchmark.implementations.items():
+        timer = timeit.Timer(lambda: implementation(data))
+        number, _ = timer.autorange()
+        times[name] = min(timer.repeat(repeat=repeat, number=number)) / number / size
+    return MicroResult(benchmark=benchmark, size=size, times=times)
+
+
+def format_results(results: Sequence[MicroResult]) -> str:
+    """
+    Formats one line per implementation, in nanoseconds per element, with its speedup over the first one.
+    """
+    lines = []
+    for result in results:
+        reference = next(iter(result.times.values()))
+        for name, elapsed in result.times.items():
+            lines.append(f"{result.benchmark.name:<20} {name:<12} {elapsed * 1e9:9.1f} ns/item  x{reference / elapsed:5.2f}")
+    return "\n".join(lines)
+
+
+# --- Replaced implementations -------------------------------------------------
+
+
+def list_windows(iterable: Iterable[Any], size: int) -> Iterator[Tuple[Any, ...]]:
+    elements = []
+    for item in iterable:
+        elements.append(item)
+        if len(elements) == size:
+            yield tuple(elements)
+            elements = elements[1:]
+
+
+def deque_windows(iterable: Iterable[Any], size: int) -> Iterator[Tuple[Any, ...]]:
+    queue = deque()
+    for item in iterable:
+        queue.append(item)
+        if len(queue) == size:
+            yield tuple(queue)
+            queue.popleft()
+
+
+def list_groups(iterable: Iterable[Any], size: int) -> Iterator[Tuple[Any, ...]]:
+    group = []
+    for element in iterable:
+        group.append(element)
+        if len(group) == size:
+            yield tuple(group)
+            group = []
+    if len(group):
+        yield tuple(group)
+
+
+# --- Benchmarks ---------------------------------------------------------------
+
+
+BENCHMARKS.append(MicroBenchmark(
+    name="pairs",
+    setup=lambda n: list(range(n)),
+    implementations={
+        "2021/01": lambda items: exhaust(list_windows(items, 2)),
+        "iterutils": lambda items: exhaust(iterutils.pairwise(items)),
+    },
+))
+
+BENCHMARKS.append(MicroBenchmark(
+    name="windows of 14",
+    setup=lambda n: "abcdefghijklm" * (n // 13),
+    implementations={
+        "2021/01": lambda buffer: exhaust(list_windows(buffer, 14)),
+        "2022/06": lambda buffer: exhaust(deque_windows(buffer, 14)),
+        "iterutils": lambda buffer: exhaust(iterutils.windowed(buffer, 14)),
+    },
+))
+
+BENCHMARKS.append(MicroBenchmark(
+    name="groups of 3",
+    setup=lambda n: list(range(n)),
+    implementations={
+        "2022/03": lambda items: exhaust(list_groups(items, 3)),
+        "iterutils": lambda items: exhaust(iterutils.grouped(items, 3)),
+    },
+))
+
+
+def rolling_sums(n: int) -> Any:
+    import numpy as np
+
+    return np.arange(n)
+
+
+BENCHMARKS.append(MicroBenchmark(
+    name="rolling sums of 3",
+    setup=rolling_sums,
+    implementations={
+        "iterutils": lambda depths: [sum(window) for window in iterutils.windowed(depths.tolist(), 3)],
+        "numpy": lambda depths: iterutils.sliding_windows(depths, 3).sum(axis=1),
+    },
+))
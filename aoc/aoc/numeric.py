@@ -0,0 +1,84 @@
+"""
+Bulk parsing of numeric inputs into NumPy arrays.
+
+Inputs like `0,9 -> 5,9` or `2-4,6-8` are mostly numbers with a fixed layout,
+so instead of matching every line against a pattern, every byte that is not a
+digit is turned into a space with `bytes.translate`, and NumPy converts the
+remaining runs of digits in a single pass. Only non-negative integers are
+recognized: a `-` is a separator, as in ranges.
+"""
+import mmap
+import re
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+Text = Union[bytes, bytearray, memoryview, mmap.mmap, str, Iterable[str]]
+"""
+Raw input bytes (as returned by `aoc.input.read_bytes`), a string, or its lines.
+"""
+
+DIGITS_ONLY = bytes(byte if ord("0") <= byte <= ord("9") else ord(" ") for byte in range(256))
+"""
+Translation table turning every byte but the ASCII digits into a space.
+"""
+
+CHUNK_LINES = 1 << 16
+
+INT64_DIGITS = 19
+"""
+Digits of the largest int64: longer numbers (and some of this length) do not fit, which NumPy silently saturates.
+"""
+
+_DIGIT = re.compile(rb"\d")
+_LONG_NUMBER = re.compile(rb"\d{%d,}" % INT64_DIGITS)
+
+
+def as_bytes(text: Text) -> bytes:
+    if isinstance(text, (bytes, bytearray, memoryview, mmap.mmap)):
+        return bytes(text)
+    if isinstance(text, str):
+        return text.encode()
+    # Lines may have been stripped of their newline: joining them on one keeps numbers apart.
+    return "\n".join(text).encode()
+
+
+def parse_ints(text: Text) -> "np.ndarray":
+    """
+    Returns every integer in `text`, in order, as an int64 array.
+    Raises `ValueError` on integers that do not fit in an int64.
+    """
+    import numpy as np
+
+    digits = as_bytes(text).translate(DIGITS_ONLY)
+    if not _DIGIT.search(digits):
+        # NumPy parses a string without any number as a single 0.
+        return np.empty(0, dtype=np.int64)
+    limit = np.iinfo(np.int64).max
+    for number in _LONG_NUMBER.findall(digits):
+        if int(number) > limit:
+            raise ValueError(f"{number.decode()} does not fit in a 64-bit integer")
+    return np.fromstring(digits, dtype=np.int64, sep=" ")
+
+
+def parse_int_rows(text: Text, columns: int) -> "np.ndarray":
+    """
+    Returns the integers of `text` as a `(rows, columns)` int64 array, for inputs with `columns` numbers per line.
+    """
+    values = parse_ints(text)
+    if len(values) % columns:
+        raise ValueError(f"Expected {columns} integers per row, found {len(values)} integers in total")
+    return values.reshape(-1, columns)
+
+
+def iter_int_rows(lines: Iterable[str], columns: int, chunk_lines: int = CHUNK_LINES) -> Iterator["np.ndarray"]:
+    """
+    Yields the integers of `lines` as `(rows, columns)` arrays of up to `chunk_lines` rows each,
+    so that a long input (or a stream) is parsed in bulk without being held in memory all at once.
+    """
+    iterator = iter(lines)
+    while chunk := list(islice(iterator, chunk_lines)):
+        yield parse_int_rows(chunk, columns)
@@ -0,0 +1,85 @@
+"""
+Content-hashed on-disk cache of parsed puzzle inputs.
+
+Entries are keyed by the SHA-256 of the input file and of the sources of the
+parser and the reader: the modules defining them and, transitively, the local
+and `aoc` modules those import, so editing any of them invalidates the entry.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "parsed"
+
+T = TypeVar("T")
+
+
+def cached_parse(parser: Callable[[Iterable[str]], T], input_path: Path, read_lines: Callable[[Path], Iterator[str]]) -> T:
+    """
+    Returns `parser(read_lines(input_path))`, loading it from the cache when possible.
+    """
+    entry = CACHE_DIR / f"{cache_key(parser, input_path, read_lines)}.pickle"
+    try:
+        with open(entry, "rb") as cached:
+            return pickle.load(cached)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+    parsed = parser(read_lines(input_path))
+    store(entry, parsed)
+    return parsed
+
+
+def cache_key(parser: Callable, input_path: Path, read_lines: Optional[Callable] = None) -> str:
+    digest = hashlib.sha256()
+    digest.update(file_digest(input_path))
+    for func in (parser, read_lines) if read_lines is not None else (parser,):
+        digest.update(source_digest(func))
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    return digest.hexdigest()
+
+
+def file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def source_digest(func: Callable) -> bytes:
+    """
+    Hashes the source file defining `func` and the local and `aoc` modules it imports, transitively,
+    so changes to its helpers are picked up too. Modules are looked up like `aoc.answers.solver_sources` does,
+    from the folder of the source file and its parent.
+    """
+    from .answers import module_sources
+
+    digest = hashlib.sha256()
+    try:
+        path = Path(inspect.getsourcefile(func))
+        for source in module_sources(path, (path.parent.parent, path.parent)):
+            digest.update(str(source).encode())
+            digest.update(file_digest(source))
+    except (TypeError, OSError, SyntaxError):
+        digest.update(func.__code__.co_code)
+    return digest.digest()
+
+
+def store(entry: Path, value: Any) -> None:
+    """
+    Atomically writes `value` to `entry`; values that cannot be pickled are not cached.
+    """
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=entry.parent, delete=False) as tmp:
+        tmp.write(payload)
+    os.replace(tmp.name, entry)
+
@@ -0,0 +1,114 @@
+"""
+Profiling of a single day solver with cProfile.
+"""
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .days import PARTS, Day, Solution, solve
+
+
+FunctionKey = Tuple[str, int, str]
+
+
+class StackSampler:
+    """
+    Samples the call stack of the current thread from a background thread,
+    counting collapsed stacks (`caller;callee count`) for flamegraphs.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread_id = threading.get_ident()
+        self._root: Optional[FrameType] = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def __enter__(self) -> "StackSampler":
+        self._root = sys._getframe(1)
+        sys.setswitchinterval(self.interval)
+        self._sampler = threading.Thread(target=self._run, daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._sampler.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._root:
+                stack.append(f"{module_name(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def write(self, path: Path) -> None:
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in self.counts.most_common()))
+
+
+def profile_day(day: Day, filename: str = "input.txt", parts: Sequence[str] = PARTS,
+                collapsed: Optional[Path] = None) -> Tuple[pstats.Stats, Solution]:
+    """
+    Solves `day` under cProfile (the module import is not profiled).
+    If `collapsed` is set, solves it once more without cProfile, sampling collapsed stacks into that file.
+    """
+    day.load()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    solution = solve(day, filename, parts=parts)
+    profiler.disable()
+    if collapsed is not None:
+        with StackSampler() as sampler:
+            solve(day, filename, parts=parts)
+        sampler.write(collapsed)
+    return pstats.Stats(profiler), solution
+
+
+def module_name(filename: str) -> str:
+    """
+    Shortens `filename` to something readable: a path below site-packages, or the file name.
+    """
+    if filename.startswith("<") or filename == "~":
+        return "<built-in>"
+    parts = Path(filename).parts
+    if "site-packages" in parts:
+        return "/".join(parts[parts.index("site-packages") + 1:])
+    return Path(filename).name
+
+
+def top_functions(stats: pstats.Stats, sort: str, limit: int) -> List[Tuple[FunctionKey, tuple]]:
+    """
+    Returns the `limit` functions with the highest `sort` time ("cumulative" or "self").
+    """
+    index = 3 if sort == "cumulative" else 2
+    entries = sorted(stats.stats.items(), key=lambda entry: entry[1][index], reverse=True)
+    return entries[:limit]
+
+
+def format_report(stats: pstats.Stats, limit: int = 15) -> str:
+    """
+    Formats the top functions by cumulative and self time, grouped by module.
+    """
+    lines = []
+    for sort in ("cumulative", "self"):
+        lines.append(f"Top {limit} functions by {sort} time (ms)")
+        groups: Dict[str, List[str]] = {}
+        for (filename, lineno, funcname), (_, ncalls, tottime, cumtime, _) in top_functions(stats, sort, limit):
+            groups.setdefault(module_name(filename), []).append(
+                f"    {cumtime * 1000:10.2f} cum  {tottime * 1000:10.2f} self  {ncalls:9d} calls  {funcname}:{lineno}"
+            )
+        for module, functions in groups.items():
+            lines.append(f"  {module}")
+            lines.extend(functions)
+        lines.append("")
+    return "\n".join(lines)
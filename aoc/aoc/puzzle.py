@@ -0,0 +1,98 @@
+"""
+Entry point of a day solver: its read, parse and solve functions, run phase by phase.
+
+Day modules register theirs as a module-level `PUZZLE`, which the runner and
+the benchmark harness look up without going through `__main__`. Older modules
+only define the functions, which are wrapped the same way.
+"""
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from . import parse_cache
+from .input import Source, is_stream, read_lines
+
+
+ENTRY_POINT = "PUZZLE"
+
+PARTS = ("part_one", "part_two")
+READ_AND_PARSE = "read+parse"
+"""
+Reading and parsing the input are a single phase: readers are lazy (they map the file, or stream it line by line),
+so the input is actually read as it is parsed, and timing them apart would charge all the I/O to parsing.
+"""
+
+PHASES = (READ_AND_PARSE, *PARTS)
+
+PhaseHook = Callable[[str, float, Any], None]
+"""
+Called after each phase with its name, its wall time in seconds and its result.
+"""
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    parse: Callable[[Iterable[str]], Any]
+    part_one: Callable[[Any], Any]
+    part_two: Callable[[Any], Any]
+    read: Callable[[Source], Iterator[str]] = read_lines
+    """
+    Returns the lines of the input, from a path or an open file; defaults to streaming its raw lines.
+    """
+
+    @classmethod
+    def of(cls, module: ModuleType) -> "Puzzle":
+        """
+        Returns the puzzle registered by `module`, or one made of its template functions.
+        """
+        entry = getattr(module, ENTRY_POINT, None)
+        if isinstance(entry, Puzzle):
+            return entry
+        return cls(
+            parse=module.parse_puzzle_lines,
+            part_one=module.solve_part_one,
+            part_two=module.solve_part_two,
+            read=getattr(module, "read_puzzle_lines", read_lines),
+        )
+
+    def phases(self, input_path: Source, parts: Sequence[str] = PARTS, cache: bool = False) -> Iterator[Tuple[str, Callable[[], Any]]]:
+        """
+        Yields the phases of a run as `(name, callable)` pairs: reading and parsing the input, then each part.
+        With `cache`, the parsed input is loaded from the parse cache when possible, skipping reading entirely.
+        Streams (like stdin) are consumed as parsing goes and are never cached.
+        """
+        puzzle = None
+
+        def parse():
+            nonlocal puzzle
+            puzzle = self.parse(self.read(input_path))
+
+        def cached_parse():
+            nonlocal puzzle
+            puzzle = parse_cache.cached_parse(self.parse, input_path, self.read)
+
+        yield READ_AND_PARSE, cached_parse if cache and not is_stream(input_path) else parse
+        for part in parts:
+            yield part, lambda part=part: getattr(self, part)(puzzle)
+
+    def run(self, input_path: Source, parts: Sequence[str] = PARTS, hook: Optional[PhaseHook] = None) -> Dict[str, Any]:
+        """
+        Solves the puzzle on `input_path` (a path or an open file), calling `hook` (by default, `print_phase`) after each phase.
+        """
+        hook = hook or print_phase
+        answers = {}
+        for phase, step in self.phases(input_path, parts):
+            start = time.perf_counter()
+            result = step()
+            hook(phase, time.perf_counter() - start, result)
+            if phase in PARTS:
+                answers[phase] = result
+        return answers
+
+
+def print_phase(phase: str, elapsed: float, result: Any) -> None:
+    line = f"{phase:<10} {elapsed * 1000:9.2f} ms"
+    if phase in PARTS:
+        line += f"  {result}"
+    print(line)
@@ -0,0 +1,145 @@
+"""
+Runs day solvers in parallel.
+"""
+import dataclasses
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence
+
+from . import answers
+from .days import PARTS, Day, Solution, solve
+from .memory import format_size
+from .spans import format_spans, to_dict
+
+if TYPE_CHECKING:
+    from .limits import Limits
+
+
+def run_days(days: Sequence[Day], filename: str = "input.txt", jobs: Optional[int] = None, cache: bool = False,
+             trace_memory: bool = False, memo: bool = False, server: Optional[Path] = None,
+             record_spans: bool = False, limits: Optional["Limits"] = None) -> Iterator[Solution]:
+    """
+    Solves `days` in a process pool, yielding each solution as soon as it is ready.
+    If `memo` is set, days whose solver and input are unchanged since they were last solved are not solved again:
+    their stored answers are yielded first.
+    If `server` is the socket of an `aoc serve` daemon, days are solved by its forked workers instead;
+    their answers are only stored if the daemon solved them with the sources they are stored under.
+    If `limits` are given, each day is solved in a worker process of its own that is killed when it goes over budget
+    (the daemon is not used then).
+    """
+    if limits is not None:
+        server = None
+    entries, digests = {}, {}
+    with executor_for(jobs, server, limits) as executor:
+        futures = {}
+        for day in days:
+            if memo:
+                try:
+                    digests[day] = answers.sources_digest(day)
+                    entries[day] = answers.entry_path(day, filename, digests[day])
+                except (OSError, SyntaxError):
+                    pass  # Missing input or broken solver: solving reports it.
+                stored = answers.load(entries[day]) if day in entries else None
+                if stored is not None:
+                    yield Solution(day=day, answers=stored, memoized=True)
+                    continue
+            if limits is not None:
+                from .limits import solve_limited
+
+                future = executor.submit(solve_limited, day, filename, limits, cache=cache, trace_memory=trace_memory,
+                                         record_spans=record_spans)
+            elif server is not None:
+                from .server import solve_remote
+
+                future = executor.submit(solve_remote, day, filename, server, cache=cache, trace_memory=trace_memory,
+                                         record_spans=record_spans)
+            else:
+                future = executor.submit(solve, day, filename, cache=cache, trace_memory=trace_memory, record_spans=record_spans)
+            futures[future] = day
+        for future in as_completed(futures):
+            solution = future.result()
+            if (
+                solution.day in entries and solution.error is None and set(solution.answers) == set(PARTS)
+                and (server is None or solution.sources == digests[solution.day])
+            ):
+                answers.store(entries[solution.day], solution.answers)
+            yield solution
+
+
+def executor_for(jobs: Optional[int], server: Optional[Path], limits: Optional["Limits"] = None) -> Executor:
+    """
+    With a daemon or limits, threads only wait for the worker processes solving each day;
+    otherwise solving happens in a pool of worker processes.
+    """
+    if server is not None or limits is not None:
+        return ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+    return ProcessPoolExecutor(max_workers=jobs)
+
+
+def format_solution(solution: Solution) -> str:
+    """
+    Formats the answers and timing of `solution` on one line.
+    Multi-line answers, per-phase memory usage, recorded spans and cache statistics follow it.
+    """
+    if solution.memoized:
+        header = f"{solution.day.name}  {'memoized':>12}"
+    else:
+        header = f"{solution.day.name}  {solution.total_time * 1000:9.2f} ms"
+    if solution.error is not None:
+        failure = "OVER BUDGET" if solution.limit is not None else "ERROR"
+        return "\n".join([f"{header}  {failure} {solution.error}", *format_memory(solution), *format_spans(solution.spans),
+                          *format_caches(solution)])
+    lines = [header]
+    for part, answer in solution.answers.items():
+        answer = str(answer)
+        if "\n" in answer:
+            lines[0] += f"  {part}=(below)"
+            lines.append(answer)
+        else:
+            lines[0] += f"  {part}={answer}"
+    lines.extend(format_memory(solution))
+    lines.extend(format_spans(solution.spans))
+    lines.extend(format_caches(solution))
+    return "\n".join(lines)
+
+
+def format_memory(solution: Solution) -> List[str]:
+    """
+    Formats the memory used by each phase of `solution`, one line per phase.
+    """
+    return [
+        f"    {phase:<10} peak {format_size(usage.peak):>10}  retained {format_size(usage.retained):>10}  blocks {usage.blocks:>9}"
+        for phase, usage in solution.memory.items()
+    ]
+
+
+def format_caches(solution: Solution) -> List[str]:
+    """
+    Formats the statistics of each cache called while solving, one line per cache.
+    """
+    return [
+        f"    cache {name}  hits {stats.hits}  misses {stats.misses}  evictions {stats.evictions}"
+        f"  size {stats.size}/{stats.maxsize if stats.maxsize is not None else 'unbounded'}  ({stats.hit_rate:.1%} hits)"
+        for name, stats in solution.caches.items()
+    ]
+
+
+def write_spans(solutions: Sequence[Solution], path: Path) -> None:
+    """
+    Writes the phase timings and recorded spans of each day to `path` as JSON.
+    """
+    report = [
+        {
+            "year": solution.day.year,
+            "day": solution.day.day,
+            "error": solution.error,
+            "limit": solution.limit,
+            "timings": solution.timings,
+            "spans": to_dict(solution.spans),
+            "caches": {name: dataclasses.asdict(stats) for name, stats in solution.caches.items()},
+        }
+        for solution in solutions
+    ]
+    path.write_text(json.dumps(report, indent=2))
@@ -0,0 +1,157 @@
+"""
+Complexity scaling checks: time solver functions on inputs of growing size and
+fit how their running time grows.
+
+Each case declares the complexity class it should have, as the exponent of its
+input size (1 for linear, 2 for quadratic). It is timed at sizes n, 2n, 4n and
+8n, and the exponent is fitted by least squares on a log-log scale, so that an
+accidentally quadratic function shows up as an exponent close to 2.
+"""
+import collections
+import math
+import random
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from .days import Day, discover_days
+from .generators import GENERATORS
+from .iterutils import windowed
+
+
+FACTORS = (1, 2, 4, 8)
+
+Setup = Callable[[int], Callable[[], Any]]
+"""
+Builds the input of size `n` and returns a call running the function under test on it.
+"""
+
+
+@dataclass(frozen=True)
+class ScalingCase:
+    name: str
+    setup: Setup
+    base_size: int
+    unit: str
+    declared: float
+    """
+    Exponent of the declared complexity class in the input size.
+    """
+
+
+@dataclass
+class ScalingResult:
+    case: ScalingCase
+    sizes: List[int]
+    times: List[float]
+    """
+    Best time of a single call at each size, in seconds.
+    """
+    exponent: float
+
+    def within(self, tolerance: float) -> bool:
+        return self.exponent <= self.case.declared + tolerance
+
+
+CASES: Dict[str, ScalingCase] = {}
+
+
+def scaling_case(name: str, base_size: int, unit: str, declared: float = 1.0) -> Callable[[Setup], Setup]:
+    """
+    Registers a scaling case, timed from `base_size` units of input upwards.
+    """
+    def register(setup: Setup) -> Setup:
+        CASES[name] = ScalingCase(name=name, setup=setup, base_size=base_size, unit=unit, declared=declared)
+        return setup
+    return register
+
+
+def measure(case: ScalingCase, factors: Sequence[int] = FACTORS, base_size: int = 0) -> ScalingResult:
+    """
+    Times `case` at each multiple of its base size and fits the growth exponent.
+    """
+    sizes = [(base_size or case.base_size) * factor for factor in factors]
+    times = []
+    for size in sizes:
+        call = case.setup(size)
+        number, total = timeit.Timer(call).autorange()
+        times.append(total / number)
+    return ScalingResult(case=case, sizes=sizes, times=times, exponent=fit_exponent(sizes, times))
+
+
+def fit_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+    """
+    Slope of the least squares line through `(log size, log time)`.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def format_results(results: Sequence[ScalingResult], tolerance: float) -> str:
+    """
+    Formats one line per case with its time at each size (in milliseconds), marking the ones that grow too fast.
+    """
+    lines = []
+    for result in results:
+        flag = "" if result.within(tolerance) else "  TOO SLOW"
+        timings = " ".join(f"{elapsed * 1000:9.2f}" for elapsed in result.times)
+        lines.append(
+            f"{result.case.name:<32} {result.sizes[0]:>7} {result.case.unit:<6} {timings} ms"
+            f"  n^{result.exponent:.2f} (declared n^{result.case.declared:g}){flag}"
+        )
+    return "\n".join(lines)
+
+
+def load_day(year: str, day: str, root: Path = Path(".")) -> Day:
+    found = discover_days(root, years=[year], days=[day])
+    if not found:
+        raise ValueError(f"No solver for {year}/{day} under {root.resolve()}")
+    return found[0]
+
+
+def generated_lines(day: Day, scale: int, seed: int = 0) -> List[str]:
+    """
+    Returns the lines of an input for `day`, `scale` times larger than its `input.txt`.
+    """
+    real_lines = day.input_path().read_text().splitlines()
+    return list(GENERATORS[(day.year, day.day)](real_lines, scale, random.Random(seed)))
+
+
+# --- Cases --------------------------------------------------------------------
+
+
+@scaling_case("iterutils windowed", base_size=50_000, unit="items")
+def windowed_items(n: int) -> Callable[[], Any]:
+    items = list(range(n))
+    return lambda: collections.deque(windowed(items, size=3), maxlen=0)
+
+
+@scaling_case("2021/14 step", base_size=4_000, unit="chars")
+def polymer_step(n: int) -> Callable[[], Any]:
+    module = load_day("2021", "14").load()
+    rng = random.Random(n)
+    elements = "BCHNOPSV"
+    rules = {first + second: rng.choice(elements) for first in elements for second in elements}
+    template = "".join(rng.choices(elements, k=n))
+    return lambda: module.step(template, rules)
+
+
+@scaling_case("2022/06 start of message", base_size=8, unit="x input")
+def tuning_trouble_marker(n: int) -> Callable[[], Any]:
+    day = load_day("2022", "06")
+    module = day.load()
+    buffer = generated_lines(day, n)[0]
+    return lambda: module.find_first_unique_sequence_in_buffer(buffer, 14)
+
+
+@scaling_case("2022/07 parse_puzzle_lines", base_size=4, unit="x input")
+def no_space_left_parse(n: int) -> Callable[[], Any]:
+    day = load_day("2022", "07")
+    module = day.load()
+    lines = generated_lines(day, n)
+    return lambda: module.parse_puzzle_lines(lines)
@@ -0,0 +1,167 @@
+"""
+Solver daemon: a preloaded interpreter that forks a worker per solve request.
+
+Requests and replies are pickled over a Unix socket, which is only accessible
+to its owner. Forked workers share the preloaded modules copy-on-write, so a
+request only pays for solving, not for starting Python and importing. A worker
+first drops the preloaded modules of any solver source edited since the daemon
+started, so that it solves the current version, and replies with the digest of
+the sources it solved with. Edits to the `aoc` package itself cannot be picked
+up that way: days depending on them fail, asking for the daemon to be restarted.
+"""
+import os
+import pickle
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Set
+
+from .answers import solver_sources, sources_digest
+from .days import Day, Solution, solve
+from .parse_cache import file_digest
+from .watch import package_changes, preload, restart_required, unload
+
+
+SOCKET_PATH = Path(os.environ.get("AOC_SOCKET", Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc")) / "serve.sock"))
+
+
+def serve(days: Sequence[Day] = (), socket_path: Path = SOCKET_PATH) -> None:
+    """
+    Imports the shared libraries and the solvers of `days`, then serves solve requests until interrupted or terminated.
+    """
+    listener = bind(socket_path)
+    previous_handlers = {
+        signal.SIGCHLD: signal.signal(signal.SIGCHLD, signal.SIG_IGN),
+        signal.SIGTERM: signal.signal(signal.SIGTERM, lambda *_: sys.exit(0)),
+    }
+    try:
+        preload()
+        for day in days:
+            try:
+                day.load()
+            except Exception:
+                pass  # Reported to whoever asks to solve it.
+        loaded = loaded_sources()
+        while True:
+            connection, _ = listener.accept()
+            if os.fork() == 0:
+                listener.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    handle(connection, loaded)
+                finally:
+                    os._exit(0)
+            connection.close()
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        listener.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def bind(socket_path: Path) -> socket.socket:
+    """
+    Listens on `socket_path`, replacing a stale socket left by a daemon that did not shut down.
+    """
+    if socket_path.exists():
+        if is_running(socket_path):
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # The socket is created with the permissions left by the umask: only the owner may ever connect to it.
+    umask = os.umask(0o177)
+    try:
+        listener.bind(str(socket_path))
+    finally:
+        os.umask(umask)
+    listener.listen()
+    return listener
+
+
+def handle(connection: socket.socket, loaded: Dict[Path, bytes]) -> None:
+    with connection:
+        request = receive(connection)
+        if not request:
+            return  # Someone checking whether the daemon is running.
+        day, filename, options = pickle.loads(request)
+        try:
+            stale = stale_sources(day, loaded)
+            sources = sources_digest(day)
+        except (OSError, SyntaxError):
+            stale, sources = set(), None  # Broken solver: solving reports it.
+        if package_changes(stale):
+            solution = restart_required(day, package_changes(stale), "serve")
+        else:
+            if stale:
+                unload(day, stale)
+            solution = solve(day, filename, **options)
+        solution.sources = sources
+        connection.sendall(pickle.dumps(solution, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def loaded_sources() -> Dict[Path, bytes]:
+    """
+    Returns the digests of the source files of the imported `aoc` modules and day solvers, as they were imported.
+    """
+    loaded = {}
+    for name, module in list(sys.modules.items()):
+        source = getattr(module, "__file__", None)
+        if (name == "aoc" or name.startswith(("aoc.", "aoc_"))) and source is not None and source.endswith(".py"):
+            loaded[Path(source).resolve()] = file_digest(Path(source))
+    return loaded
+
+
+def stale_sources(day: Day, loaded: Dict[Path, bytes]) -> Set[Path]:
+    """
+    Returns the solver sources of `day` that were imported by the daemon and have changed since.
+    """
+    return {
+        source for source in solver_sources(day)
+        if loaded.get(source.resolve(), None) not in (None, file_digest(source))
+    }
+
+
+def receive(connection: socket.socket) -> bytes:
+    """
+    Reads from `connection` until the other end stops sending.
+    """
+    chunks = []
+    while chunk := connection.recv(1 << 16):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def is_running(socket_path: Path = SOCKET_PATH) -> bool:
+    """
+    Returns whether a daemon accepts connections on `socket_path`.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def solve_remote(day: Day, filename: str = "input.txt", socket_path: Path = SOCKET_PATH, **options: Any) -> Solution:
+    """
+    Asks the daemon listening on `socket_path` to solve `day`, accepting the same options as `solve`.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(pickle.dumps((day, filename, options), protocol=pickle.HIGHEST_PROTOCOL))
+        client.shutdown(socket.SHUT_WR)
+        reply = receive(client)
+    if not reply:
+        return Solution(day=day, error="Worker exited without replying")
+    return pickle.loads(reply)
+
+
+def running_socket(socket_path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Returns `socket_path` (by default the daemon's usual socket) if a daemon is listening on it.
+    """
+    socket_path = socket_path or SOCKET_PATH
+    return socket_path if is_running(socket_path) else None
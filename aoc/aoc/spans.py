@@ -0,0 +1,115 @@
+"""
+Named timing spans that solvers use to mark their own phases.
+
+Solvers wrap sections in `span("build graph")` (or decorate functions with
+`timed`), and the runner records them per day. Spans nest: a span opened
+inside another one is recorded under its path, like `part_one/build graph`.
+When nothing is recording, `span` returns a shared no-op context manager and
+`timed` calls straight through, so instrumented code costs one global lookup.
+"""
+import contextlib
+import functools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total: float = 0.0
+    """
+    Wall time spent in the span over all its occurrences, in seconds.
+    """
+
+
+class Recorder:
+    def __init__(self):
+        self.stats: Dict[str, SpanStats] = {}
+        self.stack: List[str] = []
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "start")
+
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> None:
+        stack = self.recorder.stack
+        path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(path)
+        if path not in self.recorder.stats:
+            # Created on entry, so that spans are listed before the ones nested in them.
+            self.recorder.stats[path] = SpanStats()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_) -> None:
+        elapsed = time.perf_counter() - self.start
+        stats = self.recorder.stats[self.recorder.stack.pop()]
+        stats.count += 1
+        stats.total += elapsed
+
+
+_NOT_RECORDING = contextlib.nullcontext()
+
+_recorder: Optional[Recorder] = None
+
+
+def span(name: str) -> contextlib.AbstractContextManager:
+    """
+    Times the block as the span `name`, when spans are being recorded.
+    """
+    if _recorder is None:
+        return _NOT_RECORDING
+    return _Span(_recorder, name)
+
+
+def timed(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator timing every call of a function as the span `name` (defaults to the function name).
+    """
+    def decorate(func: F) -> F:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _Span(_recorder, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[Dict[str, SpanStats]]:
+    """
+    Records the spans entered during the block, yielding their statistics by path.
+    """
+    global _recorder
+    previous, _recorder = _recorder, Recorder()
+    try:
+        yield _recorder.stats
+    finally:
+        _recorder = previous
+
+
+def to_dict(stats: Dict[str, SpanStats]) -> Dict[str, Dict[str, float]]:
+    return {path: {"count": span_stats.count, "total": span_stats.total} for path, span_stats in stats.items()}
+
+
+def format_spans(stats: Dict[str, SpanStats]) -> List[str]:
+    """
+    Formats one line per span, indented by nesting depth, with its total time in milliseconds.
+    """
+    lines = []
+    for path, span_stats in stats.items():
+        depth = path.count("/")
+        name = path.rsplit("/", 1)[-1]
+        lines.append(f"    {'  ' * depth}{name:<{24 - 2 * depth}} {span_stats.total * 1000:9.2f} ms  x{span_stats.count}")
+    return lines
@@ -1,29 +1,24 @@
 from typing import *
 from pathlib import Path
 
+from aoc.input import read_lines
+from aoc.puzzle import Puzzle
 
-def run_puzzle(filename: str):
-    """
-    Runs today's puzzle.
-    """
-    FOLDER = Path(__file__).parent
-    puzzle_lines = read_puzzle_lines(FOLDER / filename)
-    puzzle_content = parse_puzzle_lines(puzzle_lines)
-    result_one = solve_part_one(puzzle_content)
-    print(f"The result for part 1 is {result_one}")
-    result_two = solve_part_two(puzzle_content)
-    print(f"The result for part 2 is {result_two}")
+
+FOLDER = Path(__file__).parent
 
 
 def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
-    Reads the AOC puzzle input.
+    Streams the AOC puzzle input from the memory-mapped file, one line at a time.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return read_lines(filepath, strip=True)
 
 
 def parse_puzzle_lines(lines: Iterable[str]) -> Any:
+    """
+    Parses the puzzle while iterating the lines: avoid materializing them with `list(lines)`.
+    """
     ...
 
 
@@ -35,6 +30,24 @@ def solve_part_two(puzzle: Any) -> int:
     ...
 
 
+PUZZLE = Puzzle(
+    read=read_puzzle_lines,
+    parse=parse_puzzle_lines,
+    part_one=solve_part_one,
+    part_two=solve_part_two,
+)
+"""
+Entry point used by `aoc run`, `aoc bench` and `aoc profile`.
+"""
+
+
+def run_puzzle(filename: str):
+    """
+    Runs today's puzzle, printing the answers and the time taken by each phase.
+    """
+    PUZZLE.run(FOLDER / filename)
+
+
 if __name__ == '__main__':
     run_puzzle("sample_input.txt")
     # run_puzzle("input.txt")
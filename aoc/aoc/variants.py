@@ -0,0 +1,28 @@
+"""
+Registry of alternative implementations of a day's parts.
+
+A day registers a faster (or just different) engine for one of its parts with
+`@variant("part_one")`, next to the solver it may replace; `aoc compare`
+checks it against the reference solver. This module has no dependencies, so
+that registering variants costs nothing when solving.
+"""
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+VARIANTS: Dict[str, Dict[str, Dict[str, Callable[[Any], Any]]]] = {}
+"""
+Variants by solver module, then by part and name.
+"""
+
+
+def variant(part: str, name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Registers the decorated function as an alternative solver of `part` (named after the function by default).
+    It is called like the part solver, with the parsed input, which it must not modify.
+    """
+    def decorate(func: F) -> F:
+        VARIANTS.setdefault(func.__module__, {}).setdefault(part, {})[name or func.__name__] = func
+        return func
+    return decorate
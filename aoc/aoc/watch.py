@@ -0,0 +1,109 @@
+"""
+Watch mode: a warm interpreter that re-runs days as their files change.
+
+Heavy libraries are imported once up front, and only the modules whose files
+changed are reloaded, so every re-run costs just the solving itself.
+"""
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Sequence, Set
+
+from .answers import solver_sources
+from .days import Day, Solution, solve
+
+
+PRELOADED_MODULES = ("numpy", "networkx", "parse")
+
+
+def preload(modules: Sequence[str] = PRELOADED_MODULES) -> List[str]:
+    """
+    Imports the libraries solvers share, returning the ones that are available.
+    """
+    loaded = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        loaded.append(module)
+    return loaded
+
+
+def watched_files(day: Day, filename: str = "input.txt") -> Set[Path]:
+    """
+    Returns the files whose changes affect `day`: its input and the sources its solver depends on.
+    """
+    try:
+        sources = solver_sources(day)
+    except SyntaxError:
+        sources = [day.path]
+    return {day.input_path(filename), *sources}
+
+
+def modification_times(paths: Set[Path]) -> Dict[Path, int]:
+    times = {}
+    for path in paths:
+        try:
+            times[path] = path.stat().st_mtime_ns
+        except OSError:
+            times[path] = 0
+    return times
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def package_changes(changed: Set[Path]) -> Set[Path]:
+    """
+    Returns the changed files of the `aoc` package itself. Those cannot be reloaded in a running process:
+    the runner (`aoc.days`, `aoc.puzzle`, ...) keeps using the module objects it imported.
+    """
+    return {path for path in changed if PACKAGE_DIR in path.resolve().parents}
+
+
+def restart_required(day: Day, changed: Set[Path], command: str) -> Solution:
+    names = ", ".join(sorted(path.name for path in changed))
+    return Solution(day=day, error=f"The aoc package changed ({names}): restart aoc {command} to pick it up")
+
+
+def unload(day: Day, changed: Set[Path]) -> None:
+    """
+    Forgets the solver module of `day` and every imported module defined in a changed file outside the `aoc` package,
+    so that the next run imports their current version. Changes to the package need a restart (see `package_changes`).
+    """
+    changed = {path.resolve() for path in changed - package_changes(changed)}
+    sys.modules.pop(day.module_name, None)
+    for name, module in list(sys.modules.items()):
+        source = getattr(module, "__file__", None)
+        if source is not None and Path(source).resolve() in changed:
+            del sys.modules[name]
+
+
+def watch(days: Sequence[Day], filename: str = "input.txt", interval: float = 0.5,
+          on_change: Callable[[Day], None] = lambda day: None) -> Iterator[Solution]:
+    """
+    Polls the files of `days` every `interval` seconds, yielding a new solution each time a day is affected by a change.
+    `on_change` is called before solving each affected day.
+    """
+    watched = {day: watched_files(day, filename) for day in days}
+    times = modification_times(set().union(*watched.values()))
+    while True:
+        time.sleep(interval)
+        current = modification_times(set().union(*watched.values()))
+        changed = {path for path, mtime in current.items() if times.get(path) != mtime}
+        times = current
+        if not changed:
+            continue
+        for day in days:
+            if watched[day] & changed:
+                on_change(day)
+                if package_changes(watched[day] & changed):
+                    yield restart_required(day, package_changes(watched[day] & changed), "watch")
+                    continue
+                unload(day, changed)
+                yield solve(day, filename)
+                watched[day] = watched_files(day, filename)
+        added = set().union(*watched.values()) - times.keys()
+        times.update(modification_times(added))
@@ -1,33 +1,14 @@
 import math
-import sys
 import itertools as it
 
-from typing import Any, Generator, Iterable, List, Literal, Tuple, TypeVar
+from typing import Iterable, List, Literal, Tuple
+from pathlib import Path
+from aoc.input import read_lines
+from aoc.iterutils import pairwise, window_pairs
+from aoc.variants import variant
 
 
-T = TypeVar('T', bound=Any)
-
-
-def consecutive_groups(iterable: Iterable[T], size: int = 2) -> Generator[Tuple[T, ...], None, None]:
-    """
-    Returns an iterator over consecutive pairs in `iterable`.
-    """
-    elements = []
-    for item in iterable:
-        elements.append(item)
-        if len(elements) == size:
-            yield tuple(elements)
-            elements = elements[1:]
-
-
-def consecutive_windows(iterable: Iterable[T], size: int = 2) -> Generator[Tuple[Tuple[T, ...], Tuple[T, ...]], None, None]:
-    """
-    Returns an iterator over consecutive windows of elements in `iterable`.
-    """
-    windows_1, windows_2 = it.tee(consecutive_groups(iterable, size=size), 2)
-    windows_2 = it.islice(windows_2, 1, sys.maxsize)
-    for w1, w2 in zip(windows_1, windows_2):
-        yield w1, w2
+FOLDER = Path(__file__).parent
 
 
 def compare_measurements(prev: int, next: int) -> Literal[-1, 0, 1]:
@@ -56,14 +37,43 @@ def count_increases(measurements: List[int], rolling: int = 1) -> int:
     Counts the number of times where a value in `measurements` is larger than the previous.
     """
     if rolling == 1:
-        return sum(filter(lambda val: val > 0, it.starmap(compare_measurements, consecutive_groups(measurements))))
+        return sum(filter(lambda val: val > 0, it.starmap(compare_measurements, pairwise(measurements))))
     else:
-        return sum(filter(lambda val: val > 0, it.starmap(compare_windows, consecutive_windows(measurements, size=rolling))))
+        return sum(filter(lambda val: val > 0, it.starmap(compare_windows, window_pairs(measurements, size=rolling))))
+
+
+def count_shifted_increases(measurements: List[int], rolling: int = 1) -> int:
+    """
+    Counts increases like `count_increases`, without summing windows: consecutive windows share all but
+    their first and last measurements, so comparing their sums comes down to comparing those two.
+    """
+    return sum(later > earlier for earlier, later in zip(measurements, it.islice(measurements, rolling, None)))
+
+
+def parse_puzzle_lines(lines: Iterable[str]) -> List[int]:
+    return list(map(int, lines))
+
+
+def solve_part_one(measurements: List[int]) -> int:
+    return count_increases(measurements)
+
+
+def solve_part_two(measurements: List[int]) -> int:
+    return count_increases(measurements, rolling=3)
+
+
+@variant("part_one", "shifted")
+def solve_part_one_shifted(measurements: List[int]) -> int:
+    return count_shifted_increases(measurements)
+
+
+@variant("part_two", "shifted")
+def solve_part_two_shifted(measurements: List[int]) -> int:
+    return count_shifted_increases(measurements, rolling=3)
 
 
 def read_input() -> List[int]:
-    with open('day01/input.txt', 'r') as inputfile:
-        return list(map(int, inputfile.readlines()))
+    return parse_puzzle_lines(read_lines(FOLDER / 'input.txt'))
 
 if __name__ == '__main__':
     sample_measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
@@ -1,7 +1,12 @@
 
 import functools as ft
 
-from typing import List, Literal, Tuple, TypeVar, Union
+from typing import Iterable, List, Literal, Tuple, TypeVar, Union
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 Direction = Literal['down', 'forward', 'up']
 Move = Tuple[Direction, int]
@@ -52,19 +57,39 @@ def apply_move_noaim(pos: Position, move: Move) -> Position:
             return pos[0], pos[1] - move[1]
 
 
-def read_input() -> List[Move]:
-    with open('day02/input.txt', 'r') as inputfile:
-        return list(map(parse_move, inputfile.readlines()))
+def parse_puzzle_lines(lines: Iterable[str]) -> Tuple[Position, PositionWithAim]:
+    """
+    Follows the moves as they are read, with and without aim, without keeping them.
+    """
+    pos, pos_with_aim = (0, 0), (0, 0, 0)
+    for move in map(parse_move, lines):
+        pos = apply_move_noaim(pos, move)
+        pos_with_aim = apply_move_aim(pos_with_aim, move)
+    return pos, pos_with_aim
+
+
+def solve_part_one(positions: Tuple[Position, PositionWithAim]) -> int:
+    horizontal, depth = positions[0]
+    return horizontal * depth
+
+
+def solve_part_two(positions: Tuple[Position, PositionWithAim]) -> int:
+    horizontal, depth, _ = positions[1]
+    return horizontal * depth
+
+
+def read_input() -> Tuple[Position, PositionWithAim]:
+    return parse_puzzle_lines(read_lines(FOLDER / 'input.txt'))
 
 
 if __name__ == '__main__':
     sample_moves = [('forward', 5), ('down', 5), ('forward', 8), ('up', 3), ('down', 8), ('forward', 2)]
-    actual_moves = read_input()
+    actual_position, actual_position_with_aim = read_input()
     
     assert apply_moves(sample_moves) == (15, 10)
-    assert apply_moves(actual_moves) == (1925, 879)
+    assert actual_position == (1925, 879)
     print(f'Horizontal by depth: {1925 * 879}')
 
     assert apply_moves(sample_moves, initial_pos=(0, 0, 0)) == (15, 60, 10)
-    assert apply_moves(actual_moves, initial_pos=(0, 0, 0)) == (1925, 908844, 879)
+    assert actual_position_with_aim == (1925, 908844, 879)
     print(f'Horizontal by depth: {1925 * 908844}')
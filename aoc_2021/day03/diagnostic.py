@@ -1,6 +1,11 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 import numpy as np
 from numpy.core.fromnumeric import argmax
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 
 def multiply_binary(a: str , b: str):
@@ -59,9 +64,20 @@ def find_bit_by_frequency(array: np.ndarray, col: int, argmax: bool = True, defa
 def numpy_from_bitlist(bitlist: List[str]):
     return np.array(list(map(lambda bit: [int(b) for b in list(bit)], bitlist)))
 
+def parse_puzzle_lines(lines: Iterable[str]) -> List[str]:
+    return [line.rstrip('\n') for line in lines]
+
+
+def solve_part_one(bitlist: List[str]) -> int:
+    return multiply_binary(*find_gamma_and_epsilon(bitlist))
+
+
+def solve_part_two(bitlist: List[str]) -> int:
+    return multiply_binary(*find_ogr_and_co2_sr(bitlist))
+
+
 def read_input() -> List[str]:
-    with open('day03/input.txt', 'r') as inputfile:
-        return inputfile.read().splitlines()
+    return parse_puzzle_lines(read_lines(FOLDER / 'input.txt'))
 
 
 if __name__ == '__main__':
@@ -1,8 +1,14 @@
 
+import copy
 import dataclasses
 import itertools as it
 
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 BingoNumbers = List[int]
 
@@ -107,8 +113,11 @@ def read_input(filename: str) -> Tuple[BingoNumbers, List[BingoBoard]]:
     """
     Reads bingo boards from file.
     """
-    with open(f'day04/{filename}', 'r') as bingofile:
-        lines = bingofile.readlines()
+    return parse_puzzle_lines(read_lines(FOLDER / filename))
+
+
+def parse_puzzle_lines(lines: Iterable[str]) -> Tuple[BingoNumbers, List[BingoBoard]]:
+    lines = list(lines)
     numbers = list(map(int, lines[0].strip('\n').split(',')))
     boards = []
     board = []
@@ -151,6 +160,18 @@ def compute_score(board: BingoBoard, round: int, winning_number: int) -> int:
     return board.unmarked_total() * winning_number
 
 
+def solve_part_one(bingo: Tuple[BingoNumbers, List[BingoBoard]]) -> int:
+    numbers, boards = bingo
+    _, score = find_board(numbers, copy.deepcopy(boards), best=True)
+    return score
+
+
+def solve_part_two(bingo: Tuple[BingoNumbers, List[BingoBoard]]) -> int:
+    numbers, boards = bingo
+    _, score = find_board(numbers, copy.deepcopy(boards), best=False)
+    return score
+
+
 def main(inputfile: str, expected_score: int, best: bool= True) -> None:
     numbers, boards = read_input(inputfile)
     board, score = find_board(numbers, boards, best=best)
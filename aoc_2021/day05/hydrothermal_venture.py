@@ -4,7 +4,12 @@
 import dataclasses
 from functools import reduce
 from typing import Counter, Iterable, List, Tuple
-from parse import compile
+from pathlib import Path
+from aoc.input import read_bytes
+from aoc.numeric import Text, parse_int_rows
+
+
+FOLDER = Path(__file__).parent
 
 
 @dataclasses.dataclass
@@ -46,15 +51,26 @@ def count_overlaps(vent_lines: List[VentLine], threshold: int = 2, use_diagonal:
 
 
 def read_input(input_path: str) -> List[VentLine]:
+    return parse_puzzle_lines(read_puzzle_lines(FOLDER / input_path))
+
+
+def read_puzzle_lines(input_path: Path) -> Text:
+    return read_bytes(input_path)
+
+
+def parse_puzzle_lines(text: Text) -> List[VentLine]:
     """
-    Parses the input file using `parse`.
+    Parses the `x1,y1 -> x2,y2` lines in bulk, as rows of four numbers.
     """
-    pattern = compile('{x1},{y1} -> {x2},{y2}\n')
-    with open(f'day05/{input_path}', 'r') as inputfile:
-        result = map(pattern.parse, inputfile.readlines())
-        return list(map(lambda r: VentLine(
-            start=Point(int(r['x1']), int(r['y1'])), 
-            end=Point(int(r['x2']), int(r['y2']))), result))
+    return [VentLine(start=Point(x1, y1), end=Point(x2, y2)) for x1, y1, x2, y2 in parse_int_rows(text, 4).tolist()]
+
+
+def solve_part_one(vent_lines: List[VentLine]) -> int:
+    return len(count_overlaps(vent_lines, threshold=2))
+
+
+def solve_part_two(vent_lines: List[VentLine]) -> int:
+    return len(count_overlaps(vent_lines, threshold=2, use_diagonal=True))
 
 
 def run(input_path: str, expected_counts: Tuple[int]) -> None:
@@ -1,5 +1,11 @@
 
 from typing import Counter, List
+from pathlib import Path
+from aoc.input import read_bytes
+from aoc.numeric import Text, parse_ints
+
+
+FOLDER = Path(__file__).parent
 
 
 def lanternfish_simulation(initial_fish_timers: List[int], days: int = 80) -> None:
@@ -19,8 +25,23 @@ def lanternfish_simulation(initial_fish_timers: List[int], days: int = 80) -> No
 
 
 def read_input(input_path: str) -> List[int]:
-    with open(f'day06/{input_path}', 'r') as inputfile:
-        return list(map(int, inputfile.read().split(',')))
+    return parse_puzzle_lines(read_puzzle_lines(FOLDER / input_path))
+
+
+def read_puzzle_lines(input_path: Path) -> Text:
+    return read_bytes(input_path)
+
+
+def parse_puzzle_lines(text: Text) -> List[int]:
+    return parse_ints(text).tolist()
+
+
+def solve_part_one(fish_timers: List[int]) -> int:
+    return lanternfish_simulation(fish_timers, days=80)
+
+
+def solve_part_two(fish_timers: List[int]) -> int:
+    return lanternfish_simulation(fish_timers, days=256)
 
 
 def run(input_path: str, expected_count: int, days: int) -> None:
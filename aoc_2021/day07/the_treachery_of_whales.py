@@ -2,7 +2,13 @@
 
 import numpy as np
 from typing import Iterator, List, Tuple
-from functools import lru_cache
+from pathlib import Path
+from aoc.cache import cache
+from aoc.input import read_bytes
+from aoc.numeric import Text, parse_ints
+
+
+FOLDER = Path(__file__).parent
 
 
 def compute_best_crab_position_1(positions: List[int]) -> Tuple[int, int]:
@@ -44,28 +50,37 @@ def iterpos(positions: np.ndarray) -> Iterator[int]:
     return iter(range(minval, maxval))
 
 
-OPT_VALUE = 30
-"""
-Optimization value to maximize cache hits on `movement_cost` function.
-"""
-
-
-@lru_cache()
+@cache(maxsize=2048)
 def movement_cost(move_size: int) -> int:
     """
     Movement cost calculation when taking into account crab engineering.
 
-    Calculation is split into parts to make use of the cache.
+    The cache is sized to hold every distance between two crabs of the input;
+    `aoc run` reports its hit rate.
     """
-    remainder, times = move_size % OPT_VALUE, move_size // OPT_VALUE
-    if remainder == 0 or times == 0:
-        return int(move_size * (move_size / 2) + (move_size / 2))
-    return (movement_cost(base := (times * OPT_VALUE))) + (base * remainder + movement_cost(remainder))
+    return int(move_size * (move_size / 2) + (move_size / 2))
+
+
+def read_input(input_path: str) -> np.ndarray:
+    return parse_puzzle_lines(read_puzzle_lines(FOLDER / input_path))
+
+
+def read_puzzle_lines(input_path: Path) -> Text:
+    return read_bytes(input_path)
+
+
+def parse_puzzle_lines(text: Text) -> np.ndarray:
+    return parse_ints(text)
+
+
+def solve_part_one(positions: np.ndarray) -> int:
+    _, fuel = compute_best_crab_position_1(positions)
+    return int(fuel)
 
 
-def read_input(input_path: str) -> List[int]:
-    with open(f'day07/{input_path}', 'r') as file:
-        return list(map(int, file.read().split(',')))
+def solve_part_two(positions: np.ndarray) -> int:
+    _, fuel = compute_best_crab_position_2(positions)
+    return int(fuel)
 
 
 def run(input_path: str, exp_pos: int, exp_fuel: int, part: int = 1) -> None:
@@ -1,6 +1,11 @@
 import dataclasses
 from typing import Any, Callable, Counter, Dict, Iterable, List, Optional, TypeVar
 from itertools import chain
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 
 @dataclasses.dataclass
@@ -135,8 +140,19 @@ def find(func: Callable[[T], bool], iterable: Iterable[T]) -> Optional[T]:
 
 
 def read_input(input_path: str) -> List[SevenSegmentData]:
-    with open(f'day08/{input_path}', 'r') as inputfile:
-        return list(map(SevenSegmentData.from_line, inputfile.readlines()))
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+
+def parse_puzzle_lines(lines: Iterable[str]) -> List[SevenSegmentData]:
+    return list(map(SevenSegmentData.from_line, lines))
+
+
+def solve_part_one(segment_data: List[SevenSegmentData]) -> int:
+    return sum(find_unique_digits(segment_data).values())
+
+
+def solve_part_two(segment_data: List[SevenSegmentData]) -> int:
+    return sum(decode_segment_data(segment_data))
 
 
 def run(input_path: str, expectected_count: int, exp_result: int) -> None:
@@ -1,7 +1,13 @@
 from typing import Any, List, Tuple
 import numpy as np
 import dataclasses
-import itertools as it
+from functools import cached_property
+from pathlib import Path
+from aoc.grid import Grid, neighbor_views
+from aoc.input import load_digit_grid
+
+
+FOLDER = Path(__file__).parent
 
 
 Index2D = List[Tuple[int, int]]
@@ -20,9 +26,13 @@ class SmokeBasin:
     
     def find_low_points(self) -> Index2D:
         """
-        Finds low points in the cave using `heightmap`.
+        Finds low points in the cave using `heightmap`: points no higher than any of their neighbors,
+        and lower than at least one.
         """
-        return list(filter(self.is_low_point, it.product(range(self.maxrow), range(self.maxcol))))
+        heightmap = self.heightmap
+        no_higher = np.logical_and.reduce([heightmap <= view for view in neighbor_views(heightmap, fill=10)])
+        lower = np.logical_or.reduce([heightmap < view for view in neighbor_views(heightmap, fill=0)])
+        return list(map(tuple, np.argwhere(no_higher & lower).tolist()))
 
     def find_basins(self) -> List[List[Tuple[int, int]]]:
         """
@@ -32,29 +42,31 @@ class SmokeBasin:
     
     def expand_basin(self, point: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
-        Recursively expands basin from `point`, looking for neighbors with higher values than the current point.
+        Expands basin from `point`, looking for neighbors with higher values than the current point.
         """
-        basin = []
-        if (value := self.heightmap[point]) == 9:
-            return basin
-        for neighbor in filter(lambda neigh: self.heightmap[neigh] > value, self.neighbors(*point)):
-            basin += self.expand_basin(neighbor)
-        return list(set([point] + basin))
-
-    def is_low_point(self, point: Tuple[int, int]) -> bool:
-        values = [(value := self.heightmap[point])] + arrayget(self.heightmap, self.neighbors(point))
-        return 0 == np.argmin(values) and value != np.mean(values)
-
-    def neighbors(self, point: Tuple[int, int]) -> Index2D:
+        heights, neighbors = self.heights, self.grid.neighbors.lists
+        start = self.grid.index(point)
+        if heights[start] == 9:
+            return []
+        basin, stack = {start}, [start]
+        while stack:
+            index = stack.pop()
+            for neighbor in neighbors[index]:
+                if neighbor not in basin and heights[index] < heights[neighbor] != 9:
+                    basin.add(neighbor)
+                    stack.append(neighbor)
+        return [self.grid.position(index) for index in basin]
+
+    @cached_property
+    def grid(self) -> Grid:
+        return Grid(self.heightmap)
+
+    @cached_property
+    def heights(self) -> List[int]:
         """
-        Returns neighbor indices of the node in position `[row, col]`.
+        Flat list of the heights, indexed like `grid`.
         """
-        row, col = point
-        left = col - 1 if col > 0 else None
-        right = col + 1 if col + 1 < self.maxcol else None
-        up = row - 1 if row > 0 else None
-        down = row + 1 if row + 1 < self.maxrow else None
-        return list(filter(lambda sublist: None not in sublist, [(row, left), (row, right), (up, col), (down, col)]))
+        return self.grid.flat.tolist()
 
     @property
     def maxrow(self) -> int:
@@ -65,7 +77,7 @@ class SmokeBasin:
         return self.heightmap.shape[1]
 
 def arrayget(arr: np.ndarray, index: Index2D) -> List[Any]:
-    return [arr[idx] for idx in index]
+    return [arr[idx].item() for idx in index]
 
 def compute_risk_level(low_points: List[int]) -> int:
     return sum(low_points) + len(low_points)
@@ -76,9 +88,24 @@ def compute_total_basin_value(basins: List[List[Tuple[int, int]]]) -> int:
     return one * two * three
 
 def read_input(input_path: str) -> SmokeBasin:
-    with open(f'day09/{input_path}', 'r') as inputfile:
-        heightmap = np.array([list(map(int, list(line.replace('*', '').strip('\n')))) for line in inputfile.readlines()])
-        return SmokeBasin(heightmap=heightmap)
+    return parse_puzzle_lines(read_puzzle_lines(FOLDER / input_path))
+
+
+def read_puzzle_lines(input_path: Path) -> np.ndarray:
+    return load_digit_grid(input_path)
+
+
+def parse_puzzle_lines(heightmap: np.ndarray) -> SmokeBasin:
+    return SmokeBasin(heightmap=heightmap)
+
+
+def solve_part_one(smoke_basin: SmokeBasin) -> int:
+    low_points = smoke_basin.find_low_points()
+    return int(compute_risk_level(arrayget(smoke_basin.heightmap, low_points)))
+
+
+def solve_part_two(smoke_basin: SmokeBasin) -> int:
+    return compute_total_basin_value(smoke_basin.find_basins())
 
 
 def run(input_path: str, exp_count: int, exp_total: int, exp_basin_value: int) -> None:
@@ -1,5 +1,10 @@
 import dataclasses
 from typing import Any, Callable, Iterable, List, Literal, Optional, Tuple, TypeVar, Union
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 SCORES = {
     ')': 3,
@@ -74,7 +79,7 @@ parser = ChunkParser(actions=[
 Errors = List[Tuple[int, str]]
 Completions = List[str]
 
-def parse_lines(lines: List[str]) -> Tuple[Errors, Completions]:
+def parse_lines(lines: Iterable[str]) -> Tuple[Errors, Completions]:
     errors = []
     completions = []
     for line in lines:
@@ -95,9 +100,14 @@ def find(func: Callable[[T], bool], iterable: Iterable[T]) -> Optional[T]:
     return next((item for item in iterable if func(item)), None)
 
 
-def read_input(input_path: str) -> List[str]:
-    with open(f'day10/{input_path}', 'r') as inputfile:
-        return list(map(lambda line: line.strip().rstrip('\n'), inputfile.readlines()))
+def read_input(input_path: str) -> Tuple[Errors, Completions]:
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+def parse_puzzle_lines(lines: Iterable[str]) -> Tuple[Errors, Completions]:
+    """
+    Checks each line as it is read, keeping only its error or its completion.
+    """
+    return parse_lines(line.strip() for line in lines)
 
 def compute_score(errors: List[Tuple[int, str]]) -> int:
     return sum(list(map(lambda err: SCORES[err[1]], errors)))
@@ -118,9 +128,16 @@ def compute_completion_score(completions: List[str]) -> int:
         scores.append(score)
     return sorted(scores)[len(completions) // 2]
 
+def solve_part_one(parsed: Tuple[Errors, Completions]) -> int:
+    errors, _ = parsed
+    return compute_score(errors)
+
+def solve_part_two(parsed: Tuple[Errors, Completions]) -> int:
+    _, completions = parsed
+    return compute_completion_score(completions)
+
 def run(input_path: str, exp_score: int, exp_compl_score) -> None:
-    lines = read_input(input_path)
-    errors, completions = parse_lines(lines)
+    errors, completions = read_input(input_path)
     total_score = compute_score(errors)
     print(f'There are {len(errors)} errors with a score of {total_score}')
     assert total_score == exp_score
@@ -1,5 +1,10 @@
-from typing import Callable, Counter, Dict, List
+from typing import Callable, Counter, Dict, Iterable, List
 from functools import partial
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 
 CaveGuide = Dict[str, List[str]]
@@ -46,14 +51,22 @@ def run(input_path: str, exp_count: int, exp_revisit_count: int) -> None:
     print(f'There are {count} valid paths in the cave system with revisiting')
     assert count == exp_revisit_count
 
+def solve_part_one(guide: CaveGuide) -> int:
+    return len(navigate('start', guide, ['start'], valid_fn=is_valid))
+
+def solve_part_two(guide: CaveGuide) -> int:
+    return len(navigate('start', guide, ['start'], valid_fn=is_valid_revisited))
+
 def read_input(input_path: str) -> CaveGuide:
-    with open(f'day12/{input_path}', 'r') as inputfile:
-        caves = {}
-        for line in inputfile.readlines():
-            cave_1, cave_2 = line.strip('\n').split('-')
-            caves[cave_1] = caves.get(cave_1, []) + [cave_2]
-            caves[cave_2] = caves.get(cave_2, []) + [cave_1]
-        caves['end'] = []
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+def parse_puzzle_lines(lines: Iterable[str]) -> CaveGuide:
+    caves = {}
+    for line in lines:
+        cave_1, cave_2 = line.strip('\n').split('-')
+        caves[cave_1] = caves.get(cave_1, []) + [cave_2]
+        caves[cave_2] = caves.get(cave_2, []) + [cave_1]
+    caves['end'] = []
     return caves
         
 if __name__ == '__main__':
@@ -2,6 +2,11 @@ import dataclasses
 import numpy as np
 from typing import *
 from functools import reduce
+from pathlib import Path
+from aoc.input import read_lines
+
+
+FOLDER = Path(__file__).parent
 
 
 Point = NamedTuple('Point', [('x', int), ('y', int)])
@@ -59,17 +64,39 @@ def put(data: np.ndarray, index: List[Point], func: Callable[[int], int]) -> np.
     return data
 
 
-def read_input(input_path: str) -> Tuple[List[Point], List[Tuple[FoldDirection, int]]]:
-    with open(f'day13/{input_path}', 'r') as inputfile:
-        lines = inputfile.readlines()
-        point_lines = map(lambda l: l.split(','), filter(lambda l: l.strip() and not l.startswith('fold'), lines))
-        instr_lines = filter(lambda l: l.startswith('fold'), lines)
-        points = list(map(lambda point: Point(int(point[1]), int(point[0])), point_lines))
-        instructions = map(lambda l: tuple(l.strip('\n').split(' ')[-1].split('=')), instr_lines)
-        instructions = list(map(lambda instr: ('horizontal' if instr[0] == 'x' else 'vertical', int(instr[1])), instructions))
+Instructions = List[Tuple[FoldDirection, int]]
+
+
+def read_input(input_path: str) -> Tuple[List[Point], Instructions]:
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+
+def parse_puzzle_lines(lines: Iterable[str]) -> Tuple[List[Point], Instructions]:
+    lines = list(lines)
+    point_lines = map(lambda l: l.split(','), filter(lambda l: l.strip() and not l.startswith('fold'), lines))
+    instr_lines = filter(lambda l: l.startswith('fold'), lines)
+    points = list(map(lambda point: Point(int(point[1]), int(point[0])), point_lines))
+    instructions = map(lambda l: tuple(l.strip('\n').split(' ')[-1].split('=')), instr_lines)
+    instructions = list(map(lambda instr: ('horizontal' if instr[0] == 'x' else 'vertical', int(instr[1])), instructions))
     return points, instructions
 
 
+def solve_part_one(origami: Tuple[List[Point], Instructions]) -> int:
+    points, instructions = origami
+    paper = Paper.from_points(points)
+    direction, along = instructions[0]
+    paper.fold(along, direction)
+    return len(paper.marked_locations)
+
+
+def solve_part_two(origami: Tuple[List[Point], Instructions]) -> str:
+    points, instructions = origami
+    paper = Paper.from_points(points)
+    for direction, along in instructions:
+        paper.fold(along, direction)
+    return repr(paper)
+
+
 def run(input_path: str, exp_count_first: int, exp_count: int) -> None:
     points, instructions = read_input(input_path)
     paper = Paper.from_points(points)
@@ -1,26 +1,28 @@
 
-import os
-import sys
-sys.path.append(os.path.abspath('.'))
-
 from typing import *
 from functools import reduce
 
-from day01.submarine import consecutive_groups
+from pathlib import Path
+from aoc.input import read_lines
+from aoc.iterutils import pairwise
+from aoc.variants import variant
+
+
+FOLDER = Path(__file__).parent
 
 def run_steps(template: str, rules: Dict[str, str], steps: int) -> str:
     return reduce(lambda acc, _: step(acc, rules), range(steps), template)
 
 def step(template: str, rules: Dict[str, str]) -> str:
     resulting_template = template
-    for i, pair in enumerate(map(''.join, consecutive_groups(template, size=2))):
+    for i, pair in enumerate(map(''.join, pairwise(template))):
         split_index = i * 2 + 1
         before, after = resulting_template[:split_index], resulting_template[split_index:]
         resulting_template = f'{before}{rules.get(pair, "")}{after}'
     return resulting_template
 
 def run_steps_only_count(template: str, rules: Dict[str, str], steps: int) -> Dict[str, int]:
-    counts = Counter(list(map(''.join, consecutive_groups(template, size=2))))
+    counts = Counter(list(map(''.join, pairwise(template))))
     for _ in range(steps):
         counts = step_with_counts(counts, rules)
     return counts
@@ -65,9 +67,27 @@ def run(input_path: str, exp_result_1: int, exp_result_2: int) -> None:
     print(f'After 40 steps, occurrences from most_frequent - least_frequent is {result}')
     assert result == exp_result_2
 
+def solve_part_one(polymerization: Tuple[str, Dict[str, str]]) -> int:
+    polymer, rules = polymerization
+    most_freq, least_freq = count_occurrences(run_steps(polymer, rules, 10))
+    return most_freq - least_freq
+
+@variant("part_one", "pair counts")
+def solve_part_one_by_pair_counts(polymerization: Tuple[str, Dict[str, str]]) -> int:
+    polymer, rules = polymerization
+    counts = count_letters(polymer, run_steps_only_count(polymer, rules, 10))
+    return max(counts.values()) - min(counts.values())
+
+def solve_part_two(polymerization: Tuple[str, Dict[str, str]]) -> int:
+    polymer, rules = polymerization
+    counts = count_letters(polymer, run_steps_only_count(polymer, rules, 40))
+    return max(counts.values()) - min(counts.values())
+
 def read_input(input_path: str) -> Tuple[str, Dict[str, str]]:
-    with open(f'day14/{input_path}', 'r') as inputfile:
-        lines = inputfile.readlines()
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+def parse_puzzle_lines(lines: Iterable[str]) -> Tuple[str, Dict[str, str]]:
+    lines = list(lines)
     return lines[0].strip(), dict(map(lambda line: tuple(line.strip().split(' -> ')), lines[2:]))
 
 if __name__ == '__main__':
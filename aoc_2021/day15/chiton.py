@@ -1,14 +1,23 @@
-import itertools
+from __future__ import annotations
 import numpy as np
-import networkx as nx
-from functools import cache
 
 from typing import *
+from pathlib import Path
+from aoc.grid import Grid
+from aoc.input import load_digit_grid
+from aoc.spans import format_spans, recording, timed
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+FOLDER = Path(__file__).parent
 
 
 Point = Tuple[int, int]
 
 
+@timed('search')
 def dijkstra(G: nx.Graph, source: Point, target: Point, weight: str = 'w') -> List[Point]:
     costs = {node: np.inf for node in G.nodes}
     Q = list(G.nodes)
@@ -41,6 +50,11 @@ def build_path(prec: Dict[Point, Point], source: Point, target: Point):
     return list(reversed(path))
 
 def run(input_path: str, exp_result_1: int, exp_result_2: int) -> None:
+    with recording() as spans:
+        solve(input_path, exp_result_1, exp_result_2)
+    print('\n'.join(format_spans(spans)))
+
+def solve(input_path: str, exp_result_1: int, exp_result_2: int) -> None:
     matrix = read_matrix(input_path)
     G, target = build_graph(matrix)
     path = dijkstra(G, (0,0), target)
@@ -61,6 +75,7 @@ def build_matrix_for(matrix: np.ndarray, num: int) -> np.ndarray:
     mtx[mtx > 9] = mtx[mtx > 9] % 9
     return mtx
 
+@timed('expand')
 def build_matrix(matrix: np.ndarray) -> np.ndarray:
     rows = []
     for numrow in range(5):
@@ -70,35 +85,41 @@ def build_matrix(matrix: np.ndarray) -> np.ndarray:
         rows.append(np.concatenate(row, axis=1))
     return np.array(np.concatenate(rows, axis=0))
 
+@timed('build graph')
 def build_graph(matrix: np.ndarray) -> Tuple[nx.Graph, Point]:
-    maxrow, maxcol = matrix.shape
+    import networkx as nx
+
+    grid = Grid(matrix)
+    points = grid.positions()
     G = nx.DiGraph()
-    points = list(itertools.product(range(0, maxrow), range(0, maxcol)))
     G.add_nodes_from(points)
-    for point in points:
-        for neigh in neighbors(point, maxrow, maxcol):
-            cost = matrix[neigh[0]][neigh[1]]
-            G.add_edge(point, neigh, w=cost)
-    return G, (maxrow-1, maxcol-1)
+    sources, targets = grid.neighbors.sources().tolist(), grid.neighbors.indices.tolist()
+    costs = grid.flat[grid.neighbors.indices].tolist()
+    G.add_weighted_edges_from(
+        ((points[source], points[target], cost) for source, target, cost in zip(sources, targets, costs)),
+        weight='w',
+    )
+    return G, points[-1]
 
 def compute_cost(matrix, path) -> int:
-    return sum(matrix[point] for point in path) - matrix[0, 0]
+    return sum(matrix[point].item() for point in path) - matrix[0, 0].item()
 
+@timed('parse')
 def read_matrix(input_path: str) -> np.ndarray:
-    with open(f'day15/{input_path}', 'r') as inputfile:
-        return np.array([[int(elem) for elem in line.strip()] for line in inputfile.readlines()])
-
-@cache
-def neighbors(point: Tuple[int, int], maxrow: int, maxcol: int) -> Point:
-    """
-    Returns neighbor indices of the node in position `[row, col]`.
-    """
-    row, col = point
-    left = col - 1 if col > 0 else None
-    right = col + 1 if col + 1 < maxcol else None
-    up = row - 1 if row > 0 else None
-    down = row + 1 if row + 1 < maxrow else None
-    return list(filter(lambda sublist: None not in sublist, [(row, left), (row, right), (up, col), (down, col)]))
+    return parse_puzzle_lines(read_puzzle_lines(FOLDER / input_path))
+
+def read_puzzle_lines(input_path: Path) -> np.ndarray:
+    return load_digit_grid(input_path)
+
+def parse_puzzle_lines(grid: np.ndarray) -> np.ndarray:
+    return grid
+
+def solve_part_one(matrix: np.ndarray) -> int:
+    G, target = build_graph(matrix)
+    return int(compute_cost(matrix, dijkstra(G, (0, 0), target)))
+
+def solve_part_two(matrix: np.ndarray) -> int:
+    return solve_part_one(build_matrix(matrix))
 
 
 if __name__ == '__main__':
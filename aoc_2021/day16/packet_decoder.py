@@ -4,17 +4,21 @@ import dataclasses
 import operator
 from functools import reduce
 from typing import *
+from pathlib import Path
+from aoc.cache import cache
+from aoc.input import read_lines
 
-def hex2bits(hex: str) -> str:
-    return ''.join([HEX_MAP[char] for char in hex])
 
+FOLDER = Path(__file__).parent
 
-def read_hex() -> Dict[str, str]:
-    with open('day16/hex_map.txt', 'r') as inputfile:
-        return dict([tuple(line.strip('\n').split(' = ')) for line in inputfile.readlines()])
+def hex2bits(hex: str) -> str:
+    hex_map = read_hex()
+    return ''.join([hex_map[char] for char in hex])
 
 
-HEX_MAP = read_hex()
+@cache(maxsize=1)
+def read_hex() -> Dict[str, str]:
+    return dict([tuple(line.strip('\n').split(' = ')) for line in read_lines(FOLDER / 'hex_map.txt')])
 
 
 @dataclasses.dataclass
@@ -119,8 +123,16 @@ def run2(hex: str, expected: int) -> None:
     assert value == expected
 
 def read_input(input_path: str) -> str:
-    with open(f'day16/{input_path}', 'r') as inputfile:
-        return inputfile.read().strip('\n')
+    return parse_puzzle_lines(read_lines(FOLDER / input_path))
+
+def parse_puzzle_lines(lines: Iterable[str]) -> str:
+    return ''.join(lines).strip('\n')
+
+def solve_part_one(hex: str) -> int:
+    return compute_total_version(parse_bits(hex2bits(hex))[0][0])
+
+def solve_part_two(hex: str) -> int:
+    return parse_bits(hex2bits(hex))[0][0].get_value()
 
 
 if __name__ == '__main__':
@@ -1,34 +1,50 @@
 
+import heapq
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
+from aoc.input import read_lines
 
-Calories = List[int]
 
 FOLDER = Path(__file__).parent
 
 
-def read_input(input_file: str) -> List[Calories]:
-    with open(FOLDER / input_file, 'r') as inputfile:
-        lines = inputfile.readlines()
-        return parse_elves_calories(lines)
+def read_input(input_file: str) -> List[int]:
+    return parse_elves_calories(read_lines(FOLDER / input_file))
 
 
-def parse_elves_calories(lines: List[str]) -> List[Calories]:
-    elves = []
-    calories = []
+def parse_puzzle_lines(lines: Iterable[str]) -> List[int]:
+    return parse_elves_calories(lines)
+
+
+def parse_elves_calories(lines: Iterable[str]) -> List[int]:
+    """
+    Returns the total calories carried by each elf, summing them as the lines come in.
+    """
+    totals = []
+    total = None
     for line in (line.strip() for line in lines):
         if not line:
-            elves.append(calories)
-            calories = []
+            if total is not None:
+                totals.append(total)
+            total = None
         else:
-            calories.append(int(line))
-    return elves
+            total = (total or 0) + int(line)
+    if total is not None:
+        totals.append(total)
+    return totals
+
+
+def find_most_caloric_elves(total_calories: List[int], limit: int = 1) -> int:
+    return sum(heapq.nlargest(limit, total_calories))
+
+
+def solve_part_one(total_calories: List[int]) -> int:
+    return find_most_caloric_elves(total_calories)
 
 
-def find_most_caloric_elves(elves_calories: List[Calories], limit: int = 1) -> int:
-    total_calories = (sum(calories) for calories in elves_calories)
-    return sum(sorted(list(total_calories), reverse=True)[:limit])
+def solve_part_two(total_calories: List[int]) -> int:
+    return find_most_caloric_elves(total_calories, limit=3)
 
 
 def run_puzzle(file: str):
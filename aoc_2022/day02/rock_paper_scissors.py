@@ -1,8 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import *
+from collections import Counter
 from pathlib import Path
 
+from aoc.input import read_lines
+
 WIN_SCORE = 6
 DRAW_SCORE = 3
 LOSS_SCORE = 0
@@ -80,36 +83,48 @@ class RoundPart2(Round):
         return self.match_result == "Y"
 
 
-def run_puzzle(filename: str, part: int):
+def run_puzzle(filename: str):
     """
     Runs today's puzzle.
     """
     FOLDER = Path(__file__).parent
     puzzle_lines = read_puzzle_lines(FOLDER / filename)
-    puzzle_content = parse_puzzle_lines(puzzle_lines, part=part)
-    result = compute_solution(puzzle_content)
-    print(f"The result for part {part} is {result}")
+    puzzle_content = parse_puzzle_lines(puzzle_lines)
+    result_one = solve_part_one(puzzle_content)
+    print(f"The result for part 1 is {result_one}")
+    result_two = solve_part_two(puzzle_content)
+    print(f"The result for part 2 is {result_two}")
 
 
 def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return read_lines(filepath, strip=True)
 
 
-def parse_puzzle_lines(lines: Iterable[str], part: int = 1) -> List[Round]:
-    round_type = RoundPart1 if part == 1 else RoundPart2
-    return [
-        round_type(opponents_move, your_move)
+def parse_puzzle_lines(lines: Iterable[str]) -> Counter[Tuple[str, str]]:
+    """
+    Counts how many times each pair of columns is played: there are only nine of them,
+    however long the strategy guide is.
+    """
+    return Counter(
+        (opponents_move, your_move)
         for opponents_move, your_move in
         (line.split(" ") for line in lines)
-    ]
+    )
+
 
+def solve_part_one(strategy: Counter[Tuple[str, str]]) -> int:
+    return compute_solution((RoundPart1(*columns), times) for columns, times in strategy.items())
 
-def compute_solution(rounds: List[Round]) -> Any:
-    return sum(compute_round_score(round) for round in rounds)
+
+def solve_part_two(strategy: Counter[Tuple[str, str]]) -> int:
+    return compute_solution((RoundPart2(*columns), times) for columns, times in strategy.items())
+
+
+def compute_solution(rounds: Iterable[Tuple[Round, int]]) -> Any:
+    return sum(compute_round_score(round) * times for round, times in rounds)
 
 
 def compute_round_score(round: Round) -> int:
@@ -126,8 +141,5 @@ def compute_shape_score(move: str) -> int:
     return ["Rock", "Paper", "Scissors"].index(move) + 1
 
 if __name__ == '__main__':
-    run_puzzle("sample_input.txt", part=1)
-    run_puzzle("input.txt", part=1)
-
-    run_puzzle("sample_input.txt", part=2)
-    run_puzzle("input.txt", part=2)
+    run_puzzle("sample_input.txt")
+    run_puzzle("input.txt")
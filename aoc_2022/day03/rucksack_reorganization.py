@@ -6,6 +6,9 @@ import string
 from typing import *
 from pathlib import Path
 
+from aoc.input import read_lines
+from aoc.iterutils import grouped
+
 
 @dataclass
 class Rucksack:
@@ -40,9 +43,9 @@ def run_puzzle(filename: str):
     FOLDER = Path(__file__).parent
     puzzle_lines = read_puzzle_lines(FOLDER / filename)
     puzzle_content = parse_puzzle_lines(puzzle_lines)
-    result_one = compute_part_one(puzzle_content)
+    result_one = solve_part_one(puzzle_content)
     print(f"The result for part 1 is {result_one}")
-    result_two = compute_part_two(puzzle_content)
+    result_two = solve_part_two(puzzle_content)
     print(f"The result for part 2 is {result_two}")
 
 
@@ -50,8 +53,7 @@ def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return read_lines(filepath, strip=True)
 
 
 def parse_puzzle_lines(lines: Iterable[str]) -> List[Rucksack]:
@@ -65,7 +67,7 @@ def split_compartments(line: str) -> Tuple[Compartment, Compartment]:
     return Compartment(left), Compartment(right)
 
 
-def compute_part_one(rucksacks: List[Rucksack]) -> int:
+def solve_part_one(rucksacks: List[Rucksack]) -> int:
     wrong_items = list(chain(*(rucksack.find_wrong_items() for rucksack in rucksacks)))
     priorities = list(map(item_to_priority, wrong_items))
     total_priority = sum(priorities)
@@ -79,26 +81,13 @@ def item_to_priority(item: str) -> int:
     return PRIORITIES[item]
 
 
-def compute_part_two(rucksacks: List[Rucksack]) -> int:
-    elf_groups = grouped(rucksacks, groupsize=3)
+def solve_part_two(rucksacks: List[Rucksack]) -> int:
+    elf_groups = grouped(rucksacks, size=3)
     badges = (find_bagde(elf_group) for elf_group in elf_groups)
     priorities = map(item_to_priority, badges)
     return sum(priorities)
 
 
-ElemT = TypeVar("ElemT")
-
-def grouped(iterable: Iterable[ElemT], groupsize: int = 2) -> Iterable[Tuple[ElemT, ...]]:
-    group = []
-    for element in iterable:
-        group.append(element)
-        if len(group) == groupsize:
-            yield tuple(group)
-            group = []
-    if len(group):
-        yield tuple(group)
-
-
 def find_bagde(group: Tuple[Rucksack, ...]) -> str:
     shared_items = reduce(set.intersection, (rucksack.unique_items() for rucksack in group))
     return list(shared_items)[0]
@@ -3,22 +3,17 @@ from dataclasses import dataclass
 from typing import *
 from pathlib import Path
 
+from aoc.input import read_lines
+from aoc.numeric import iter_int_rows
 
-@dataclass
-class Assignment:
-    start: int
-    end: int
-
-    def __contains__(self, other: Any) -> bool:
-        interval = range(self.start, self.end+1)
-        if isinstance(other, int):
-            return other in interval
-        if isinstance(other, Assignment):
-            return (other.start in interval and other.end in interval)
-        return NotImplemented
 
-    def overlaps_with(self, other: Assignment) -> bool:
-        return any(right.start in left or right.end in left for left, right in [(self, other), (other, self)])
+@dataclass
+class PairCounts:
+    """
+    How many assignment pairs meet each part's condition, counted while reading the pairs.
+    """
+    containing: int = 0
+    overlapping: int = 0
 
 
 def run_puzzle(filename: str):
@@ -28,9 +23,9 @@ def run_puzzle(filename: str):
     FOLDER = Path(__file__).parent
     puzzle_lines = read_puzzle_lines(FOLDER / filename)
     puzzle_content = parse_puzzle_lines(puzzle_lines)
-    result_one = compute_part_1(puzzle_content)
+    result_one = solve_part_one(puzzle_content)
     print(f"The result for part 1 is {result_one}")
-    result_two = compute_part_2(puzzle_content)
+    result_two = solve_part_two(puzzle_content)
     print(f"The result for part 2 is {result_two}")
 
 
@@ -38,37 +33,31 @@ def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
-
+    return read_lines(filepath, strip=True)
 
-def parse_puzzle_lines(lines: Iterable[str]) -> List[Tuple[Assignment, Assignment]]:
-    return [
-        (assignment_from_section(first_section), assignment_from_section(second_section))
-        for first_section, second_section in (line.split(",") for line in lines)
-    ]
 
-def assignment_from_section(section: str) -> Assignment:
-    section_range = map(int, section.split("-"))
-    return Assignment(*section_range)
-
-
-def compute_part_1(assignment_pairs: List[Tuple[Assignment, Assignment]]) -> int:
-    return count_pairs(assignment_pairs, lambda left, right: left in right or right in left)
+def parse_puzzle_lines(lines: Iterable[str]) -> PairCounts:
+    """
+    Counts the pairs a chunk of `a-b,c-d` lines at a time, comparing all the sections of a chunk at once.
+    """
+    counts = PairCounts()
+    for rows in iter_int_rows(lines, 4):
+        left_start, left_end, right_start, right_end = rows.T
+        left_in_right = (right_start <= left_start) & (left_end <= right_end)
+        right_in_left = (left_start <= right_start) & (right_end <= left_end)
+        counts.containing += int((left_in_right | right_in_left).sum())
+        counts.overlapping += int(((left_start <= right_end) & (right_start <= left_end)).sum())
+    return counts
 
 
-def compute_part_2(assignment_pairs: List[Tuple[Assignment, Assignment]]) -> int:
-    return count_pairs(assignment_pairs, lambda left, right: left.overlaps_with(right))
+def solve_part_one(counts: PairCounts) -> int:
+    return counts.containing
 
 
-def count_pairs(pairs, condition) -> int:
-    return sum(1 for left, right in pairs if condition(left, right))
+def solve_part_two(counts: PairCounts) -> int:
+    return counts.overlapping
 
 
 if __name__ == '__main__':
     run_puzzle("sample_input.txt")
     run_puzzle("input.txt")
-
-    a1 = Assignment(5, 9)
-    a2 = Assignment(4, 10)
-    print(a1.overlaps_with(a2))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 from copy import deepcopy
 from dataclasses import dataclass
-import re
 from typing import *
 from pathlib import Path
 from collections import deque
 
+from aoc.input import read_lines
+from aoc.numeric import parse_int_rows
+
 
 @dataclass
 class CraneMover:
@@ -72,8 +74,7 @@ def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line for line in puzzle_file)
+    return read_lines(filepath)
 
 
 def parse_puzzle_lines(lines: Iterable[str]) -> CraneMover:
@@ -102,12 +103,10 @@ def filterwhile(iterable: Iterable, condition: Callable) -> Iterator:
 
 
 def parse_instructions(lines: Iterator[str]) -> List[Instruction]:
-    return [parse_instruction(line) for line in lines]
-
-
-def parse_instruction(line: str) -> Instruction:
-    elements = re.findall(r"^move (\d+) from (\d+) to (\d+)$", line)[0]
-    return Instruction(*map(int, elements))
+    """
+    Parses the `move n from a to b` lines in bulk, as rows of three numbers.
+    """
+    return [Instruction(*row) for row in parse_int_rows(lines, 3).tolist()]
 
 
 def solve_part_one(puzzle: CraneMover) -> str:
@@ -1,9 +1,9 @@
-from collections import deque
 from typing import *
 from pathlib import Path
 
+from aoc.input import read_lines
+from aoc.iterutils import first, windowed
 
-ElemT = TypeVar("ElemT")
 
 def solve_part_one(buffer: str) -> int:
     return find_start_of_packet(buffer)
@@ -18,20 +18,9 @@ def find_start_of_message(buffer: str):
     return find_first_unique_sequence_in_buffer(buffer, 14)
 
 def find_first_unique_sequence_in_buffer(buffer: str, sequence_length: int) -> int:
-    windows = windowed(buffer, sequence_length)
-    marker = first(windows, lambda window: len(set(window)) == sequence_length)
-    return buffer.index("".join(marker)) + len(marker)
-
-def first(iterable: Iterable[ElemT], condition: Callable[[ElemT], bool]) -> ElemT:
-    return next(element for element in iterable if condition(element))
-
-def windowed(iterable: Iterable[ElemT], window_size: int) -> Iterator[Tuple[ElemT, ...]]:
-    queue = deque()
-    for item in iterable:
-        queue.append(item)
-        if len(queue) == window_size:
-            yield tuple(queue)
-            queue.popleft()
+    windows = enumerate(windowed(buffer, sequence_length))
+    start, _ = first(windows, lambda window: len(set(window[1])) == sequence_length)
+    return start + sequence_length
 
 
 def run_puzzle(filename: str):
@@ -51,8 +40,7 @@ def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return read_lines(filepath, strip=True)
 
 
 def parse_puzzle_lines(lines: Iterable[str]) -> str:
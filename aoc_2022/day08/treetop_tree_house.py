@@ -5,6 +5,11 @@ from itertools import chain, takewhile
 from typing import *
 from pathlib import Path
 
+from aoc.input import load_digit_grid
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class TreePatch:
@@ -44,16 +49,15 @@ def run_puzzle(filename: str):
     print(f"The result for part 2 is {result_two}")
 
 
-def read_puzzle_lines(filepath: Path) -> Iterator[str]:
+def read_puzzle_lines(filepath: Path) -> np.ndarray:
     """
-    Reads the AOC puzzle input.
+    Reads the AOC puzzle input as a grid of digits.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return load_digit_grid(filepath)
 
 
-def parse_puzzle_lines(lines: Iterable[str]) -> TreePatch:
-    return TreePatch(trees=[list(map(int, line)) for line in lines])
+def parse_puzzle_lines(grid: np.ndarray) -> TreePatch:
+    return TreePatch(trees=grid.tolist())
 
 
 def solve_part_one(patch: TreePatch) -> int:
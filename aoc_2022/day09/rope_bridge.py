@@ -4,6 +4,8 @@ from itertools import pairwise
 from typing import *
 from pathlib import Path
 
+from aoc.input import read_lines
+
 
 @dataclass(frozen=True)
 class Position:
@@ -38,8 +40,7 @@ def read_puzzle_lines(filepath: Path) -> Iterator[str]:
     """
     Reads the AOC puzzle input.
     """
-    with open(filepath, "r") as puzzle_file:
-        yield from (line.strip() for line in puzzle_file)
+    return read_lines(filepath, strip=True)
 
 
 def parse_puzzle_lines(lines: Iterable[str]) -> List[Tuple[str, int]]: